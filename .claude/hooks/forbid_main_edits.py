@@ -1,14 +1,51 @@
 #!/usr/bin/env python3
-import json, subprocess, sys
+import os, subprocess, sys
 
-data = json.load(sys.stdin)
-project = subprocess.check_output(["bash","-lc","pwd"]).decode().strip()
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+data = loads(sys.stdin.buffer.read())
+project = os.getcwd()
+
+def git_state(*queries):
+    """Answer several `git rev-parse` questions with a single subprocess.
+
+    Returns one string per query, parsed from newline-delimited output.
+    """
+    result = subprocess.run(
+        ["git", "-C", project, "rev-parse", *queries],
+        capture_output=True, text=True, check=False,
+    )
+    lines = result.stdout.strip().split("\n")
+    return lines + [""] * (len(queries) - len(lines))
+
+BRANCH_CACHE = os.path.join(project, ".claude", "state", "branch_cache")
+GIT_HEAD = os.path.join(project, ".git", "HEAD")
 
 def current_branch():
+    # The branch can only change when .git/HEAD does, so a cache file whose
+    # mtime is newer than HEAD's lets us skip the git spawn entirely.
     try:
-        return subprocess.check_output(["git","-C",project,"branch","--show-current"]).decode().strip()
-    except Exception:
-        return ""
+        if os.path.getmtime(BRANCH_CACHE) > os.path.getmtime(GIT_HEAD):
+            with open(BRANCH_CACHE) as f:
+                return f.read().strip()
+    except OSError:
+        pass
+
+    branch = git_state("--abbrev-ref", "HEAD")[0]
+
+    try:
+        os.makedirs(os.path.dirname(BRANCH_CACHE), exist_ok=True)
+        tmp = BRANCH_CACHE + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(branch)
+        os.replace(tmp, BRANCH_CACHE)
+    except OSError:
+        pass
+
+    return branch
 
 branch = current_branch()
 if branch in ("main", "master"):
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Persistent test driver for the Substack Friend Finder extension.
+
+Launching Chrome (profile setup + browser startup) dominates each run of
+test_extension.py. This driver launches the browser once and then serves
+test requests over a Unix socket, so repeated runs only pay for the tests
+themselves.
+
+Usage:
+    python extension/driver.py --serve    # start the driver (stays running)
+    python extension/driver.py johndoe    # send a request to a running driver
+
+Requests are newline-delimited JSON: {"username": "...", or null}.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.async_api import async_playwright
+
+from test_extension import launch_test_context, run_test_suite
+
+SOCKET_PATH = "/tmp/sff_test_driver.sock"
+
+
+async def serve(skip_extension: bool = False):
+    """Launch the browser once and serve test requests until interrupted."""
+    import shutil
+
+    async with async_playwright() as p:
+        context, temp_profile = await launch_test_context(p, skip_extension)
+
+        # Runs share one context, and each run's cleanup closes every page
+        # in it - overlapping requests would abort each other
+        run_lock = asyncio.Lock()
+
+        async def handle(reader, writer):
+            try:
+                line = await reader.readline()
+                request = json.loads(line) if line.strip() else {}
+                async with run_lock:
+                    await run_test_suite(context, request.get("username"))
+                writer.write(b'{"ok": true}\n')
+            except Exception as e:
+                writer.write(json.dumps({"ok": False, "error": str(e)}).encode() + b"\n")
+            finally:
+                await writer.drain()
+                writer.close()
+
+        if os.path.exists(SOCKET_PATH):
+            os.unlink(SOCKET_PATH)
+
+        server = await asyncio.start_unix_server(handle, path=SOCKET_PATH)
+        print(f"\nDriver ready on {SOCKET_PATH} (Ctrl-C to stop)")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await context.close()
+            shutil.rmtree(temp_profile, ignore_errors=True)
+            if os.path.exists(SOCKET_PATH):
+                os.unlink(SOCKET_PATH)
+
+
+async def request(username: str = None):
+    """Send a test request to a running driver and wait for the result."""
+    reader, writer = await asyncio.open_unix_connection(SOCKET_PATH)
+    writer.write(json.dumps({"username": username}).encode() + b"\n")
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    writer.close()
+
+    if not response.get("ok"):
+        print(f"Driver error: {response.get('error')}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("username", nargs="?", help="Substack username to test (sends to a running driver)")
+    parser.add_argument("--serve", action="store_true", help="Start the persistent driver")
+    parser.add_argument("--skip-extension", action="store_true", help="Skip loading extension")
+    args = parser.parse_args()
+
+    if args.serve:
+        asyncio.run(serve(args.skip_extension))
+    else:
+        try:
+            asyncio.run(request(args.username))
+        except (ConnectionRefusedError, FileNotFoundError):
+            # No driver listening, or a stale socket from a crashed one
+            print(f"Driver not running; start it with: python {sys.argv[0]} --serve")
+            sys.exit(1)
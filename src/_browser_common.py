@@ -0,0 +1,178 @@
+"""Helpers shared by the sync (browser) and async (browser_async) clients.
+
+Anything that doesn't touch a live Playwright object lives here, so the
+two clients can't drift apart on rate limiting, cookie extraction, cache
+layout, or handle parsing, and neither pays the other's module-init cost.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+# Cookie extraction from the user's own browsers
+try:
+    import browser_cookie3
+    HAS_BROWSER_COOKIE3 = True
+except ImportError:
+    HAS_BROWSER_COOKIE3 = False
+
+# orjson is much faster on the multi-MB subscriber-list payloads;
+# stdlib json handles the same bytes if it isn't installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from .types import UserProfile
+
+# Handle and user-id lookups are stable mappings, so cache them for longer
+# than the default 24h
+HANDLE_CACHE_TTL = 30 * 86400  # 30 days
+
+# Subscriber/follower lists churn much faster than handles, so keep them
+# fresh enough that repeated runs in one sitting skip the browser
+LIST_CACHE_TTL = 6 * 3600  # 6 hours
+
+# Pulls the handle out of an /@handle or substack.com/@handle href
+_AT_HANDLE_RE = re.compile(r'/@([a-zA-Z0-9_-]+)')
+
+# Patterns for finding an author handle in publication page HTML
+_HANDLE_PATTERNS = (
+    re.compile(r'substack\.com/@([a-zA-Z0-9_-]+)'),  # Full URL pattern
+    re.compile(r'href="/@([^"/?]+)"'),               # Relative link pattern
+    re.compile(r'"handle":"([^"]+)"'),               # JSON data pattern
+)
+
+# Resources to drop during navigation - we only care about the page HTML
+# and the subscriber-lists XHR, not avatars, fonts, or trackers
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+BLOCKED_URL_SUBSTRINGS = ("google-analytics", "doubleclick", "segment.io", "hotjar")
+
+
+class TokenBucket:
+    """Token-bucket rate limiter.
+
+    Permits bursts of up to ``capacity`` back-to-back requests (a fanout of
+    subscriptions + subscribers + followers fires without mandatory pauses)
+    while the sustained rate stays bounded by ``refill_rate`` tokens/sec.
+    """
+
+    # Adaptive-rate bounds: additive increase while responses are clean,
+    # multiplicative decrease when the server pushes back, converging to
+    # the highest sustainable rate instead of a hand-picked constant
+    MAX_RATE = 1.0     # tokens/sec ceiling
+    MIN_RATE = 0.05    # tokens/sec floor
+    DELTA = 0.02       # additive increase per clean response
+    BETA = 0.5         # multiplicative decrease on pushback
+
+    def __init__(self, capacity: int = 5, refill_rate: float = 1 / 3.0):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self.tokens = float(capacity)
+        self.last_refill = time.time()
+
+    def _refill(self) -> None:
+        now = time.time()
+        self.tokens = min(
+            float(self.capacity),
+            self.tokens + (now - self.last_refill) * self.refill_rate,
+        )
+        self.last_refill = now
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until the bucket refills if it's empty."""
+        self._refill()
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.refill_rate)
+            self._refill()
+        self.tokens -= 1
+
+    def increase_rate(self) -> None:
+        """Nudge the refill rate up after a clean response."""
+        self.refill_rate = min(self.MAX_RATE, self.refill_rate + self.DELTA)
+
+    def decrease_rate(self) -> None:
+        """Halve the refill rate and drain the bucket after pushback.
+
+        The next acquire() pays a full refill interval instead of bursting
+        straight back into a throttling server.
+        """
+        self.refill_rate = max(self.MIN_RATE, self.refill_rate * self.BETA)
+        self.tokens = 0.0
+
+
+@lru_cache(maxsize=1)
+def _get_browser_cookies() -> tuple[tuple, bool]:
+    """Get Substack cookies from user's browser (Firefox, Chrome, Safari).
+
+    Memoized for the process lifetime; both init_browser and the
+    undetected-Chrome path consume the same extraction.
+
+    Returns:
+        Tuple of (cookies, whether a substack.sid session cookie was found)
+    """
+    if not HAS_BROWSER_COOKIE3:
+        print("browser_cookie3 not installed. Run: pip install browser_cookie3")
+        return (), False
+
+    cookies = []
+    has_session = False
+
+    # Try browsers in order: Firefox, Chrome, Safari
+    browsers = [
+        ("Firefox", browser_cookie3.firefox),
+        ("Chrome", browser_cookie3.chrome),
+        ("Safari", browser_cookie3.safari),
+    ]
+
+    for name, browser_fn in browsers:
+        try:
+            cj = browser_fn(domain_name=".substack.com")
+            for c in cj:
+                has_session |= c.name == "substack.sid"
+                cookies.append({
+                    "name": c.name,
+                    "value": c.value,
+                    "domain": ".substack.com",
+                    "path": c.path or "/",
+                })
+            if cookies:
+                print(f"Loaded {len(cookies)} cookies from {name}")
+                return tuple(cookies), has_session
+        except Exception as e:
+            # Silently try next browser
+            pass
+
+    return tuple(cookies), has_session
+
+
+@lru_cache(maxsize=1)
+def _find_firefox_profile() -> Optional[str]:
+    """Find the user's Firefox profile directory."""
+    # macOS path
+    mac_path = os.path.expanduser("~/Library/Application Support/Firefox/Profiles")
+    # Linux path
+    linux_path = os.path.expanduser("~/.mozilla/firefox")
+
+    profile_dir = mac_path if os.path.exists(mac_path) else linux_path
+
+    if not os.path.exists(profile_dir):
+        return None
+
+    # Find the default-release profile (most recently used)
+    profiles = glob.glob(os.path.join(profile_dir, "*.default-release*"))
+    if not profiles:
+        profiles = glob.glob(os.path.join(profile_dir, "*.default*"))
+
+    if profiles:
+        # Return the most recently modified one
+        return max(profiles, key=os.path.getmtime)
+
+    return None
+
+
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-import glob
+import atexit
+import fcntl
 import json
 import os
+import queue
 import shutil
 import tempfile
+import threading
 import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -23,8 +29,28 @@ try:
 except ImportError:
     HAS_UNDETECTED_CHROME = False
 
-from .cache import cache
-from .types import Newsletter, UserProfile
+# playwright-stealth patches the fingerprints Cloudflare uses to spot
+# headless browsers; with it installed we can skip the GUI process
+try:
+    from playwright_stealth import stealth_sync
+    HAS_STEALTH = True
+except ImportError:
+    HAS_STEALTH = False
+
+from ._browser_common import (
+    BLOCKED_RESOURCE_TYPES,
+    BLOCKED_URL_SUBSTRINGS,
+    HANDLE_CACHE_TTL,
+    LIST_CACHE_TTL,
+    TokenBucket,
+    _AT_HANDLE_RE,
+    _HANDLE_PATTERNS,
+    _find_firefox_profile,
+    _get_browser_cookies,
+    _json_loads,
+)
+from .cache import CACHE_DIR, cache, is_negative
+from .types import Newsletter, UserProfile, _users_from_soa, _users_to_soa
 
 # Browser instance (reused across calls)
 _playwright: Optional[Playwright] = None
@@ -32,24 +58,119 @@ _browser: Optional[Browser] = None
 _context: Optional[BrowserContext] = None
 _page: Optional[Page] = None
 
+# Whether the current browser is headless; when stealth-headless fails to
+# clear Cloudflare, fetches relaunch headed via _relaunch_headed()
+_headless = False
+
 # Undetected Chrome driver (for Cloudflare-protected endpoints)
 _chrome_driver = None
 
-# Rate limiting - use random delays to appear more human
+# In-browser probes for the author handle, tried in order
+_HANDLE_PROBES = (
+    """() => document.querySelector('a[href*="/@"]')?.getAttribute('href')""",
+    """() => document.querySelector('meta[property="author:username"]')?.content""",
+    """() => {
+        for (const s of document.querySelectorAll('script[type="application/json"]')) {
+            const m = s.textContent.match(/"handle":"([^"]+)"/);
+            if (m) return m[1];
+        }
+        return null;
+    }""",
+)
+
+# Persistent copy of the user's Firefox profile, seeded once and reused
+# across runs so Cloudflare clearance cookies and caches stay hot
+PERSISTENT_PROFILE_DIR = Path.home() / ".cache" / "substack_ff_profile"
+_profile_lock_file = None
+
+# Warm page pool - creating a page spawns a Firefox content process, so
+# reuse a fixed set instead of opening/closing one per request
+POOL_SIZE = 4
+_page_pool: Optional[queue.Queue] = None
+
+# In-flight fetches by cache key, so concurrent callers coalesce onto one
+_inflight: Dict[str, threading.Event] = {}
+_inflight_lock = threading.Lock()
+
+# Fetch helper installed once per page via add_init_script, so each API
+# call evaluates a tiny invocation instead of reparsing a full function,
+# and URLs travel as arguments rather than interpolated into source
+_FETCH_HELPER_JS = """
+window.__fetchApi = async (url) => {
+    const response = await fetch(url, {
+        credentials: 'include',
+        headers: { 'Accept': 'application/json' },
+        keepalive: true,
+    });
+    if (!response.ok) {
+        return { error: response.status, message: await response.text() };
+    }
+    return { text: await response.text() };
+};
+window.__fetchAll = (urls) => Promise.all(
+    urls.map((u) => window.__fetchApi(u).catch((e) => ({ error: -1, message: String(e) })))
+);
+"""
+
+
+def _block_noncritical(route) -> None:
+    """Route handler that aborts image/font/media/analytics requests."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        d in request.url for d in BLOCKED_URL_SUBSTRINGS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+# Rate limiting
 import random
-MIN_REQUEST_INTERVAL = 8.0  # minimum seconds between requests
-MAX_REQUEST_INTERVAL = 15.0  # maximum seconds between requests
-_last_request_time = 0.0
+
+_bucket = TokenBucket()
+
+# Bucket state and browser storage persisted across CLI invocations, so
+# back-to-back runs respect the same sustained rate and skip re-clearing
+# Cloudflare on warm starts
+RATE_STATE_FILE = CACHE_DIR / "rate.json"
+STORAGE_STATE_FILE = CACHE_DIR / "storage.json"
+
+
+def _load_bucket_state() -> None:
+    """Restore the token bucket from the previous process, if recorded."""
+    try:
+        with open(RATE_STATE_FILE, "r") as f:
+            state = json.load(f)
+        _bucket.tokens = min(float(_bucket.capacity), float(state["tokens"]))
+        _bucket.last_refill = float(state["last_refill"])
+        _bucket.refill_rate = min(
+            TokenBucket.MAX_RATE,
+            max(TokenBucket.MIN_RATE, float(state.get("refill_rate", _bucket.refill_rate))),
+        )
+    except (IOError, ValueError, KeyError):
+        pass
 
 
-def _rate_limit() -> None:
-    """Ensure we don't exceed rate limits with random human-like delays."""
-    global _last_request_time
-    delay = random.uniform(MIN_REQUEST_INTERVAL, MAX_REQUEST_INTERVAL)
-    elapsed = time.time() - _last_request_time
-    if elapsed < delay:
-        time.sleep(delay - elapsed)
-    _last_request_time = time.time()
+def _save_bucket_state() -> None:
+    """Record the token bucket so the next process resumes the same pace."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(RATE_STATE_FILE, "w") as f:
+            json.dump({
+                "tokens": _bucket.tokens,
+                "last_refill": _bucket.last_refill,
+                "refill_rate": _bucket.refill_rate,
+            }, f)
+    except IOError:
+        pass
+
+
+_load_bucket_state()
+atexit.register(_save_bucket_state)
+
+
+def _rate_limit(domain: str = "substack.com") -> None:
+    """Ensure we don't exceed rate limits via the shared token bucket."""
+    _bucket.acquire()
 
 
 def _new_stealth_page() -> Page:
@@ -58,116 +179,142 @@ def _new_stealth_page() -> Page:
     if not _context:
         raise RuntimeError("Browser not initialized")
     page = _context.new_page()
-    # Temporarily disabled stealth to debug response capture issue
-    # stealth_sync(page)
+    if HAS_STEALTH:
+        stealth_sync(page)
     return page
 
 
-def _get_browser_cookies() -> List[Dict]:
-    """Get Substack cookies from user's browser (Firefox, Chrome, Safari)."""
-    try:
-        import browser_cookie3
-    except ImportError:
-        print("browser_cookie3 not installed. Run: pip install browser_cookie3")
-        return []
-
-    cookies = []
+def _init_page_pool() -> None:
+    """Pre-populate the warm page pool from the active context."""
+    global _page_pool
+    _page_pool = queue.Queue()
+    for _ in range(POOL_SIZE):
+        _page_pool.put(_new_stealth_page())
 
-    # Try browsers in order: Firefox, Chrome, Safari
-    browsers = [
-        ("Firefox", browser_cookie3.firefox),
-        ("Chrome", browser_cookie3.chrome),
-        ("Safari", browser_cookie3.safari),
-    ]
 
-    for name, browser_fn in browsers:
+@contextmanager
+def checkout_page():
+    """Check a warm page out of the pool, returning it blanked afterwards."""
+    if not _page_pool:
+        raise RuntimeError("Browser not initialized")
+    page = _page_pool.get()
+    try:
+        yield page
+    finally:
         try:
-            cj = browser_fn(domain_name=".substack.com")
-            for c in cj:
-                cookies.append({
-                    "name": c.name,
-                    "value": c.value,
-                    "domain": ".substack.com",
-                    "path": c.path or "/",
-                })
-            if cookies:
-                print(f"Loaded {len(cookies)} cookies from {name}")
-                return cookies
-        except Exception as e:
-            # Silently try next browser
+            # Reset navigation state; callers must remove their own listeners
+            page.goto("about:blank")
+            _page_pool.put(page)
+        except Exception:
+            # Page died; replace it so the pool doesn't shrink
+            _page_pool.put(_new_stealth_page())
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Copy a file, hardlinking only immutable IndexedDB blobs.
+
+    Blob files under idb *.files directories are content-addressed and
+    never rewritten, so sharing them via hardlink is safe and skips
+    copying the bulk of storage/. Everything else (sqlite databases,
+    their -wal/-shm journals, metadata) is rewritten in place by the
+    launched Firefox, and a hardlink would write through into the user's
+    live profile - those get a real copy.
+    """
+    if os.path.basename(os.path.dirname(src)).endswith(".files"):
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
             pass
-
-    return cookies
+    shutil.copy2(src, dst)
 
 
-def _find_firefox_profile() -> Optional[str]:
-    """Find the user's Firefox profile directory."""
-    # macOS path
-    mac_path = os.path.expanduser("~/Library/Application Support/Firefox/Profiles")
-    # Linux path
-    linux_path = os.path.expanduser("~/.mozilla/firefox")
-
-    profile_dir = mac_path if os.path.exists(mac_path) else linux_path
-
-    if not os.path.exists(profile_dir):
-        return None
+def _lock_persistent_profile() -> bool:
+    """Take an exclusive lock on the persistent profile dir.
 
-    # Find the default-release profile (most recently used)
-    profiles = glob.glob(os.path.join(profile_dir, "*.default-release*"))
-    if not profiles:
-        profiles = glob.glob(os.path.join(profile_dir, "*.default*"))
-
-    if profiles:
-        # Return the most recently modified one
-        profiles.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-        return profiles[0]
-
-    return None
+    A second process failing the lock falls back to the cookie-based path
+    rather than corrupting the profile.
+    """
+    global _profile_lock_file
+    try:
+        PERSISTENT_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        _profile_lock_file = open(PERSISTENT_PROFILE_DIR / ".lock", "w")
+        fcntl.flock(_profile_lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        if _profile_lock_file:
+            _profile_lock_file.close()
+            _profile_lock_file = None
+        print("Persistent profile in use by another process; falling back to cookies.")
+        return False
 
 
-def init_browser(cookies_file: Optional[str] = None) -> bool:
+def init_browser(cookies_file: Optional[str] = None, headless: Optional[bool] = None) -> bool:
     """
     Initialize the browser with cookies from user's existing browser session.
 
     Automatically pulls cookies from Firefox/Chrome/Safari.
 
+    Args:
+        cookies_file: Optional explicit cookies file
+        headless: Force headless on/off; defaults to headless only when
+            the stealth patches are available to cover for it
+
     Returns:
         True if browser initialized successfully
     """
-    global _playwright, _browser, _context, _page
+    global _playwright, _browser, _context, _page, _headless
+
+    if headless is None:
+        headless = HAS_STEALTH
+    _headless = headless
 
     _playwright = sync_playwright().start()
 
     # Try to use Firefox profile directly for better Cloudflare compatibility
     firefox_profile = _find_firefox_profile()
-    if firefox_profile:
+    if firefox_profile and _lock_persistent_profile():
         print(f"Using Firefox profile: {firefox_profile}")
         try:
-            # Copy profile to avoid conflicts with running Firefox
-            temp_profile = tempfile.mkdtemp(prefix="substack_firefox_")
-            print(f"Copying profile to temp location...")
-
-            # Only copy essential files for session state
-            essential_files = [
-                "cookies.sqlite",
-                "permissions.sqlite",
-                "prefs.js",
-                "storage",
-            ]
-            for item in essential_files:
-                src = os.path.join(firefox_profile, item)
-                dst = os.path.join(temp_profile, item)
-                if os.path.exists(src):
+            # Seed the persistent profile once; later runs reuse it as-is,
+            # skipping the copy of storage/ (often hundreds of MB)
+            if not (PERSISTENT_PROFILE_DIR / "cookies.sqlite").exists():
+                print(f"Seeding persistent profile from Firefox...")
+
+                # Only copy essential files for session state
+                essential_files = [
+                    "cookies.sqlite",
+                    "permissions.sqlite",
+                    "prefs.js",
+                    "storage",
+                ]
+                for item in essential_files:
+                    src = os.path.join(firefox_profile, item)
+                    dst = os.path.join(PERSISTENT_PROFILE_DIR, item)
+                    if not os.path.exists(src):
+                        continue
                     if os.path.isdir(src):
-                        shutil.copytree(src, dst, dirs_exist_ok=True)
+                        # storage/ is dominated by immutable IndexedDB
+                        # blobs, which _link_or_copy hardlinks; the sqlite
+                        # files Firefox rewrites are copied for real
+                        shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=_link_or_copy)
                     else:
+                        # prefs.js and the sqlite DBs get rewritten by the
+                        # launched Firefox, so a hardlink would clobber the
+                        # user's live profile - copy them for real
                         shutil.copy2(src, dst)
 
             _context = _playwright.firefox.launch_persistent_context(
-                temp_profile,
-                headless=False,
+                str(PERSISTENT_PROFILE_DIR),
+                # Headless saves hundreds of MB of GUI/renderer processes,
+                # but only passes Cloudflare with the stealth patches in
+                headless=headless,
                 viewport={"width": 1280, "height": 720},
             )
+            # Skip images/fonts/trackers - networkidle waits for all of them
+            _context.route("**/*", _block_noncritical)
+            _context.add_init_script(_FETCH_HELPER_JS)
+            _init_page_pool()
             print("Browser initialized with Firefox profile.")
             return True
         except Exception as e:
@@ -175,40 +322,63 @@ def init_browser(cookies_file: Optional[str] = None) -> bool:
             print("Falling back to cookie-based approach...")
 
     # Fallback: Get cookies from user's browser
-    cookies = _get_browser_cookies()
+    cookies, has_session = _get_browser_cookies()
     if not cookies:
         print("Could not get cookies from any browser.")
         print("Make sure you're logged into Substack in Firefox, Chrome, or Safari.")
         return False
 
     # Verify we have session cookie
-    has_session = any(c["name"] == "substack.sid" for c in cookies)
     if not has_session:
         print("Warning: No session cookie found. Please log into Substack in your browser and try again.")
         return False
 
-    # Start browser (Firefox works better with Cloudflare than Chromium)
-    _browser = _playwright.firefox.launch(headless=False)
+    # Start browser (Firefox works better with Cloudflare than Chromium);
+    # headless only when the stealth patches can cover for it
+    _browser = _playwright.firefox.launch(headless=headless)
     _context = _browser.new_context(
         user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:146.0) Gecko/20100101 Firefox/146.0",
         viewport={"width": 1280, "height": 720},
+        # Reuse last run's storage (Cloudflare clearance included) so warm
+        # starts skip the challenge wait
+        storage_state=str(STORAGE_STATE_FILE) if STORAGE_STATE_FILE.exists() else None,
     )
 
+    # Skip images/fonts/trackers - networkidle waits for all of them
+    _context.route("**/*", _block_noncritical)
+    _context.add_init_script(_FETCH_HELPER_JS)
+
     # Add cookies from user's browser
-    _context.add_cookies(cookies)
+    _context.add_cookies(list(cookies))
 
     # Don't navigate to substack.com - it breaks subsequent subdomain navigation
     # The cookies already have Cloudflare clearance from Firefox
+    _init_page_pool()
     print("Browser initialized with session cookies.")
     return True
 
 
 def close_browser() -> None:
     """Close the browser."""
-    global _playwright, _browser, _context, _page, _chrome_driver
+    global _playwright, _browser, _context, _page, _chrome_driver, _page_pool, _profile_lock_file
+    if _page_pool:
+        while not _page_pool.empty():
+            try:
+                _page_pool.get_nowait().close()
+            except Exception:
+                pass
+        _page_pool = None
     if _page:
         _page.close()
     if _context:
+        if _browser:
+            # Snapshot cookies/localStorage for the next run's warm start
+            # (the persistent-profile path keeps its state on disk already)
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                _context.storage_state(path=str(STORAGE_STATE_FILE))
+            except Exception:
+                pass
         _context.close()
     if _browser:
         _browser.close()
@@ -216,6 +386,9 @@ def close_browser() -> None:
         _playwright.stop()
     if _chrome_driver:
         _chrome_driver.quit()
+    if _profile_lock_file:
+        _profile_lock_file.close()  # releases the flock
+        _profile_lock_file = None
     _playwright = None
     _browser = None
     _context = None
@@ -223,6 +396,20 @@ def close_browser() -> None:
     _chrome_driver = None
 
 
+def _relaunch_headed() -> bool:
+    """Tear down a headless browser and come back with a real window.
+
+    Stealth-headless normally clears Cloudflare; when it doesn't, every
+    fetch in the run would fail with no recovery, so headed mode stays
+    available as the fallback.
+    """
+    if not _headless:
+        return False
+    print("  Relaunching headed browser as Cloudflare fallback...")
+    close_browser()
+    return init_browser(headless=False)
+
+
 def _init_undetected_chrome() -> bool:
     """Initialize undetected Chrome driver for Cloudflare bypass."""
     global _chrome_driver
@@ -244,29 +431,32 @@ def _init_undetected_chrome() -> bool:
         options.add_argument("--window-size=1280,720")
 
         # Get cookies from Chrome to add to the session
-        cookies = _get_browser_cookies()
+        cookies, _ = _get_browser_cookies()
 
         _chrome_driver = uc.Chrome(options=options)
 
-        # Navigate to substack and add cookies
-        _chrome_driver.get("https://substack.com")
-        time.sleep(2)
-
-        # Add substack cookies
-        for cookie in cookies:
-            try:
-                _chrome_driver.add_cookie({
-                    "name": cookie["name"],
-                    "value": cookie["value"],
-                    "domain": cookie.get("domain", ".substack.com"),
-                    "path": cookie.get("path", "/"),
-                })
-            except:
-                pass
+        # Inject all cookies in one CDP call - per-cookie add_cookie is a
+        # DevTools round-trip each, and setCookies needs no navigation first
+        try:
+            _chrome_driver.execute_cdp_cmd("Network.setCookies", {
+                "cookies": [
+                    {
+                        "name": cookie["name"],
+                        "value": cookie["value"],
+                        "domain": cookie.get("domain", ".substack.com"),
+                        "path": cookie.get("path", "/"),
+                    }
+                    for cookie in cookies
+                ],
+            })
+        except Exception as e:
+            print(f"Could not set cookies via CDP: {e}")
 
-        # Refresh to apply cookies
-        _chrome_driver.refresh()
-        time.sleep(2)
+        # Navigate once to establish a cleared substack.com origin; later
+        # calls fetch() from this page instead of re-navigating
+        _chrome_driver.get("https://substack.com")
+        if "Just a moment" in _chrome_driver.page_source:
+            time.sleep(10)
 
         print("Undetected Chrome driver initialized.")
         return True
@@ -294,67 +484,42 @@ def _fetch_subscriber_lists_chrome(author_handle: str, list_type: str = "subscri
     _rate_limit()
 
     try:
-        # First, get the user ID from the profile
-        profile_url = f"https://substack.com/@{author_handle}"
-        _chrome_driver.get(profile_url)
-
-        # Wait for page to load
-        time.sleep(random.uniform(3, 5))
-
-        # Check for Cloudflare challenge
-        if "Just a moment" in _chrome_driver.page_source:
-            time.sleep(10)
-
-        # Get user ID from the profile API
-        profile_api_url = f"https://substack.com/api/v1/user/{author_handle}/public_profile"
-        profile_result = _chrome_driver.execute_async_script(f"""
-            var callback = arguments[arguments.length - 1];
-            fetch("{profile_api_url}", {{
-                credentials: 'include',
-                headers: {{'Accept': 'application/json'}}
-            }})
-            .then(r => r.json())
-            .then(data => callback(data))
-            .catch(e => callback({{error: e.toString()}}));
-        """)
-
-        if not profile_result or "error" in profile_result:
-            return None
+        # handle -> user_id is stable; skip the profile round-trip on repeats
+        user_id = cache.get(f"userid:{author_handle}")
 
-        user_id = profile_result.get("id")
-        if not user_id:
-            return None
-
-        # Navigate to the subscribers/followers page
-        url = f"https://substack.com/@{author_handle}/{list_type}"
-        _chrome_driver.get(url)
-        time.sleep(random.uniform(2, 4))
-
-        # Execute JavaScript to fetch the API data directly using user ID
-        api_url = f"https://substack.com/api/v1/user/{user_id}/subscriber-lists?lists={list_type}"
-
-        # Use async/await properly in the execute_script
+        # The driver already has cookies and a cleared substack.com origin
+        # from init, so fetch() directly without navigating. When the user
+        # ID isn't cached, chain the profile and subscriber-lists fetches
+        # inside one execute_async_script round-trip.
         result = _chrome_driver.execute_async_script(f"""
             var callback = arguments[arguments.length - 1];
-            fetch("{api_url}", {{
+            var userId = arguments[0];
+            var getJson = (url) => fetch(url, {{
                 credentials: 'include',
                 headers: {{'Accept': 'application/json'}}
-            }})
-            .then(r => {{
-                console.log('Status:', r.status);
-                if (!r.ok) {{
-                    return r.text().then(text => ({{error: r.status, body: text.substring(0, 200)}}));
-                }}
-                return r.json();
-            }})
-            .then(data => callback(data))
-            .catch(e => callback({{error: e.toString()}}));
-        """)
-
-        if isinstance(result, dict) and "error" in result:
+            }}).then(r => r.ok ? r.json() : Promise.reject('HTTP ' + r.status));
+
+            var idPromise = userId
+                ? Promise.resolve(userId)
+                : getJson("https://substack.com/api/v1/user/{author_handle}/public_profile")
+                    .then(p => p.id || Promise.reject('no user id'));
+
+            idPromise
+                .then(id => getJson(
+                    "https://substack.com/api/v1/user/" + id + "/subscriber-lists?lists={list_type}"
+                ).then(data => callback({{userId: id, data: data}})))
+                .catch(e => callback({{error: String(e)}}));
+        """, user_id)
+
+        if not result or "error" in result:
+            if result and ("403" in result["error"] or "429" in result["error"]):
+                _bucket.decrease_rate()
             return None
 
-        return result
+        if not user_id and result.get("userId"):
+            cache.set(f"userid:{author_handle}", result["userId"], ttl=HANDLE_CACHE_TTL)
+
+        return result.get("data")
     except Exception as e:
         return None
 
@@ -363,7 +528,7 @@ def _fetch_api(url: str, params: Optional[Dict[str, str]] = None) -> Optional[Di
     """Fetch from Substack API using the browser."""
     global _page
 
-    if not _page:
+    if not (_page or _page_pool):
         print("Browser not initialized. Call init_browser() first.")
         return None
 
@@ -377,38 +542,91 @@ def _fetch_api(url: str, params: Optional[Dict[str, str]] = None) -> Optional[Di
         full_url = url
 
     try:
-        # Use page.evaluate to make fetch request with browser's cookies
-        result = _page.evaluate(f"""
-            async () => {{
-                const response = await fetch("{full_url}", {{
-                    credentials: 'include',
-                    headers: {{
-                        'Accept': 'application/json',
-                    }}
-                }});
-                if (!response.ok) {{
-                    return {{ error: response.status, message: await response.text() }};
-                }}
-                return await response.json();
-            }}
-        """)
-
-        if isinstance(result, dict) and "error" in result:
-            print(f"API error {result['error']}: {result.get('message', '')[:100]}")
-            return None
+        for attempt in range(3):
+            # Invoke the pre-installed helper with the browser's cookies;
+            # it returns raw text, deserialized in Python below
+            if _page:
+                result = _page.evaluate("(u) => window.__fetchApi(u)", full_url)
+            else:
+                with checkout_page() as page:
+                    result = page.evaluate("(u) => window.__fetchApi(u)", full_url)
+
+            if isinstance(result, dict) and "error" in result:
+                message = result.get("message", "")
+                print(f"API error {result['error']}: {message[:100]}")
+                throttled = (
+                    result["error"] in (429, 403, 503)
+                    or "Just a moment" in message
+                )
+                if not throttled:
+                    return None
+                # Back off the sustained rate and retry with jitter
+                _bucket.decrease_rate()
+                time.sleep(2 ** attempt + random.random())
+                continue
+
+            _bucket.increase_rate()
+            return _json_loads(result["text"])
 
-        return result
+        return None
     except Exception as e:
         print(f"Error fetching {url}: {e}")
         return None
 
 
+# How many API URLs to fetch per rate-limit slot
+BATCH_SIZE = 10
+
+
+def _fetch_api_batch(urls: List[str]) -> List[Optional[Dict]]:
+    """
+    Fetch several Substack API URLs in one page.evaluate via Promise.all.
+
+    Substack's own frontend fires many concurrent API calls from one
+    Cloudflare-cleared origin, so a batch costs one rate-limit slot and one
+    browser round-trip instead of one each per URL.
+
+    Returns one result per URL, None for failures, in input order.
+    """
+    global _page
+
+    if not (_page or _page_pool):
+        print("Browser not initialized. Call init_browser() first.")
+        return [None] * len(urls)
+
+    results: List[Optional[Dict]] = []
+    for start in range(0, len(urls), BATCH_SIZE):
+        batch = urls[start:start + BATCH_SIZE]
+        _rate_limit()
+        try:
+            # The browser multiplexes the batch over one HTTP/2 connection;
+            # raw text comes back and is deserialized here (see _fetch_api)
+            if _page:
+                batch_results = _page.evaluate("(us) => window.__fetchAll(us)", batch)
+            else:
+                with checkout_page() as page:
+                    batch_results = page.evaluate("(us) => window.__fetchAll(us)", batch)
+            results.extend(
+                _json_loads(r["text"]) if isinstance(r, dict) and "text" in r else None
+                for r in batch_results
+            )
+        except Exception as e:
+            print(f"Error fetching batch: {e}")
+            results.extend([None] * len(batch))
+    return results
+
+
+def _hydrate(cls, cached: List[Dict]) -> List:
+    """Rebuild dataclass instances from their cached asdict() form."""
+    return [cls(**d) for d in cached]
+
+
 def get_user_subscriptions_browser(username: str) -> List[Newsletter]:
     """Get a user's subscriptions using the browser."""
     cache_key = f"subscriptions:{username}"
     cached = cache.get(cache_key)
     if cached:
-        return [Newsletter(**n) for n in cached]
+        return _hydrate(Newsletter, cached)
 
     url = f"https://substack.com/api/v1/user/{username}/public_profile"
     data = _fetch_api(url)
@@ -416,235 +634,185 @@ def get_user_subscriptions_browser(username: str) -> List[Newsletter]:
     if not data:
         return []
 
-    subs_data = data.get("subscriptions", [])
+    newsletters = _parse_subscriptions(data)
+
+    # Cache results
+    cache.set(cache_key, [asdict(n) for n in newsletters])
+
+    return newsletters
+
+
+def _parse_subscriptions(data: Dict) -> List[Newsletter]:
+    """Parse the subscriptions out of a public_profile API response."""
     newsletters = []
 
-    for sub in subs_data:
-        pub = sub.get("publication", {})
+    for sub in data.get("subscriptions", []):
+        pub = sub.get("publication")
         if not pub:
             continue
 
-        author = pub.get("author", {})
-        author_id = pub.get("author_id") or pub.get("primary_user_id") or author.get("id", 0)
+        author = pub.get("author")
+        author_id = (
+            pub.get("author_id")
+            or pub.get("primary_user_id")
+            or (author.get("id", 0) if author else 0)
+        )
+        subdomain = pub.get("subdomain") or ""
 
         newsletter = Newsletter(
             id=pub.get("id", 0),
             name=pub.get("name", "Unknown"),
-            subdomain=pub.get("subdomain", ""),
+            subdomain=subdomain,
             author_id=author_id,
             subscriber_count=pub.get("subscriber_count", 0),
-            url=f"https://{pub.get('subdomain', '')}.substack.com" if pub.get("subdomain") else None,
+            url=f"https://{subdomain}.substack.com" if subdomain else None,
         )
         newsletters.append(newsletter)
 
-    # Cache results
-    cache.set(cache_key, [
-        {
-            "id": n.id,
-            "name": n.name,
-            "subdomain": n.subdomain,
-            "author_id": n.author_id,
-            "subscriber_count": n.subscriber_count,
-            "url": n.url,
-        }
-        for n in newsletters
-    ])
-
     return newsletters
 
 
-def _get_author_handle(subdomain: str) -> Optional[str]:
-    """Get the author's handle from a publication subdomain."""
-    global _context
-
-    if not _context:
-        return None
-
-    _rate_limit()
-
-    # Use a fresh page to avoid React routing issues
-    page = _new_stealth_page()
-
-    try:
-        # Navigate directly to publication (don't reuse main page)
-        page.goto(f"https://{subdomain}.substack.com", wait_until="load", timeout=30000)
-
-        # Handle Cloudflare if needed
-        for _ in range(6):
-            if "Just a moment" in page.content():
-                time.sleep(5)
-            else:
-                break
-
-        time.sleep(1)
+def get_user_subscriptions_browser_batch(usernames: List[str]) -> Dict[str, List[Newsletter]]:
+    """
+    Get subscriptions for several users with one batched browser fetch.
 
-        # Look for author link in the page content
-        content = page.content()
-        import re
+    Cached users are served from cache; the misses share rate-limit slots
+    via _fetch_api_batch.
+    """
+    results: Dict[str, List[Newsletter]] = {}
+    misses: List[str] = []
+
+    for username in usernames:
+        cached = cache.get(f"subscriptions:{username}")
+        if cached:
+            results[username] = _hydrate(Newsletter, cached)
+        else:
+            misses.append(username)
+
+    if not misses:
+        return results
+
+    urls = [f"https://substack.com/api/v1/user/{u}/public_profile" for u in misses]
+    writes: Dict[str, List[Dict]] = {}
+    for username, data in zip(misses, _fetch_api_batch(urls)):
+        if not data:
+            results[username] = []
+            continue
 
-        # Try multiple patterns
-        patterns = [
-            r'substack\.com/@([a-zA-Z0-9_-]+)',  # Full URL pattern
-            r'href="/@([^"/?]+)"',               # Relative link pattern
-            r'"handle":"([^"]+)"',               # JSON data pattern
-        ]
+        newsletters = _parse_subscriptions(data)
+        writes[f"subscriptions:{username}"] = [asdict(n) for n in newsletters]
+        results[username] = newsletters
 
-        for pattern in patterns:
-            match = re.search(pattern, content)
-            if match:
-                return match.group(1)
-    except Exception as e:
-        print(f"  Error getting author handle: {e}")
-    finally:
-        page.close()
+    # One batched log append for the whole fetch instead of a write per user
+    cache.mset(writes)
 
-    return None
+    return results
 
 
-def get_publication_subscribers_browser(author_handle: str, limit: int = 100) -> List[UserProfile]:
-    """
-    Get subscribers of a publication by navigating to the subscribers page.
+def _user_from_dict(d: Dict) -> UserProfile:
+    """Build a UserProfile from a raw API user dict (or a cached copy of one)."""
+    primary_pub = d.get("primaryPublication")
+    return UserProfile(
+        id=d.get("id", 0),
+        username=d.get("handle") or d.get("username", ""),
+        name=d.get("name", ""),
+        bio=d.get("bio"),
+        photo_url=d.get("photo_url"),
+        has_publication=bool(primary_pub or d.get("has_publication")),
+        publication_url=primary_pub.get("url") if primary_pub else d.get("publication_url"),
+        follower_count=d.get("followerCount", d.get("follower_count", 0)),
+    )
 
-    Args:
-        author_handle: The author's handle (e.g., 'andrewjrose')
-        limit: Maximum number of subscribers to fetch
 
-    Returns:
-        List of UserProfile objects for subscribers
-    """
+def _get_author_handle(subdomain: str) -> Optional[str]:
+    """Get the author's handle from a publication subdomain."""
     global _context
 
     if not _context:
-        print("Browser not initialized")
-        return []
+        return None
 
-    cache_key = f"subscribers_browser:{author_handle}:{limit}"
+    # The subdomain -> handle mapping is stable, so cache it across runs
+    cache_key = f"handle:{subdomain}"
     cached = cache.get(cache_key)
     if cached:
-        return [UserProfile(**p) for p in cached]
+        return cached
+
+    # Try the JSON homepage endpoint first: a few KB instead of a fully
+    # rendered publication page
+    data = _fetch_api(f"https://{subdomain}.substack.com/api/v1/homepage")
+    if data:
+        handle = ((data.get("publication") or {}).get("author") or {}).get("handle")
+        if handle:
+            cache.set(cache_key, handle, ttl=HANDLE_CACHE_TTL)
+            return handle
 
     _rate_limit()
 
-    # Use fresh page to avoid React routing issues
-    page = _new_stealth_page()
+    # Fall back to scraping the rendered page for the handle
+    with checkout_page() as page:
+        try:
+            # Navigate directly to publication (don't reuse main page)
+            resp = page.goto(f"https://{subdomain}.substack.com", wait_until="load", timeout=30000)
 
-    # Capture API response via interception
-    captured_data: List[Dict] = []
+            # Fast path: a challenged navigation answers 403/503
+            if resp and resp.status in (403, 503):
+                _bucket.decrease_rate()
 
-    def handle_response(response):
-        if "subscriber-lists" in response.url and "substack.com/api" in response.url:
+            # Wait out any Cloudflare challenge with a single event-driven
+            # wait on the (cheap) title instead of re-serializing the DOM
             try:
-                if response.status == 200:
-                    captured_data.append(response.json())
-            except:
+                page.wait_for_function(
+                    "() => !document.title.includes('Just a moment')",
+                    timeout=30000,
+                )
+            except Exception:
                 pass
 
-    page.on("response", handle_response)
-
-    try:
-        # Navigate to profile first (more human-like)
-        profile_url = f"https://substack.com/@{author_handle}"
-        page.goto(profile_url, wait_until="networkidle", timeout=60000)
-        time.sleep(random.uniform(1, 2))  # Human-like pause
-
-        # Click on Subscribers link
-        try:
-            subs_link = page.locator("text=Subscribers").first
-            if subs_link.is_visible():
-                subs_link.click()
-                page.wait_for_load_state("networkidle", timeout=30000)
-                time.sleep(2)
-            else:
-                page.goto(f"{profile_url}/subscribers", wait_until="networkidle", timeout=60000)
-        except:
-            page.goto(f"{profile_url}/subscribers", wait_until="networkidle", timeout=60000)
-
-        # Wait for Cloudflare if needed
-        for _ in range(6):
-            if "Just a moment" in page.content():
-                time.sleep(5)
-            else:
-                break
-
-        time.sleep(2)  # Wait for API response
-
-    except Exception as e:
-        print(f"  Navigation error: {e}")
-
-    page.remove_listener("response", handle_response)
-    page.close()
-
-    if not captured_data:
-        # Try undetected Chrome as fallback (works better with Cloudflare)
-        if HAS_UNDETECTED_CHROME:
-            data = _fetch_subscriber_lists_chrome(author_handle, "subscribers")
-            if data:
-                captured_data = [data]
+            # Probe the DOM in the browser instead of serializing the
+            # whole page over the wire and regex-scanning it in Python
+            for probe in _HANDLE_PROBES:
+                found = page.evaluate(probe)
+                if not found:
+                    continue
+                match = _AT_HANDLE_RE.search(found)
+                handle = match.group(1) if match else found
+                cache.set(cache_key, handle, ttl=HANDLE_CACHE_TTL)
+                return handle
+        except Exception as e:
+            print(f"  Error getting author handle: {e}")
 
-    if not captured_data:
-        return []
+    return None
 
-    data = captured_data[0]
 
-    if not data:
-        print("  Could not fetch subscriber data")
+def _read_cached_users(cache_key: str) -> Optional[List[UserProfile]]:
+    """Return a cached user list, [] for a cached failure, None on a miss."""
+    cached = cache.get(cache_key)
+    if cached is None:
+        return None
+    if is_negative(cached):
         return []
+    # SoA dict from current code; entries written before the layout
+    # change are still lists of raw API dicts
+    if isinstance(cached, dict):
+        return _users_from_soa(cached)
+    return [_user_from_dict(p) for p in cached]
 
-    # Response structure: { subscriberLists: [{ groups: [{ users: [...] }] }] }
-    subscribers = []
-    all_users = []
-
-    subscriber_lists = data.get("subscriberLists", [])
-    for sub_list in subscriber_lists:
-        groups = sub_list.get("groups", [])
-        for group in groups:
-            users = group.get("users", [])
-            all_users.extend(users)
-
-    print(f"  Got {len(all_users)} total subscribers")
-    subscriber_list = all_users[:limit]
-
-    for s in subscriber_list:
-        profile = UserProfile(
-            id=s.get("id", 0),
-            username=s.get("handle", s.get("username", "")),
-            name=s.get("name", ""),
-            bio=s.get("bio"),
-            photo_url=s.get("photo_url"),
-            has_publication=bool(s.get("primaryPublication")),
-            publication_url=s.get("primaryPublication", {}).get("url") if s.get("primaryPublication") else None,
-            follower_count=s.get("followerCount", 0),
-        )
-        subscribers.append(profile)
-
-    # Cache results
-    cache.set(cache_key, [
-        {
-            "id": p.id,
-            "username": p.username,
-            "name": p.name,
-            "bio": p.bio,
-            "photo_url": p.photo_url,
-            "has_publication": p.has_publication,
-            "publication_url": p.publication_url,
-            "follower_count": p.follower_count,
-        }
-        for p in subscribers
-    ])
-
-    return subscribers
 
-
-def get_publication_followers_browser(author_handle: str, limit: int = 100) -> List[UserProfile]:
+def _get_subscriber_list(author_handle: str, list_type: str, limit: int) -> List[UserProfile]:
     """
-    Get followers of a publication by navigating to the followers page.
+    Get a publication's subscriber or follower list by navigating to its page.
+
+    Failed fetches are negative-cached for a few minutes, and concurrent
+    callers asking for the same key share one fetch instead of each paying
+    the Cloudflare-bearing navigation.
 
     Args:
         author_handle: The author's handle (e.g., 'andrewjrose')
-        limit: Maximum number of followers to fetch
+        list_type: "subscribers" or "followers"
+        limit: Maximum number of users to fetch
 
     Returns:
-        List of UserProfile objects for followers
+        List of UserProfile objects
     """
     global _context
 
@@ -652,104 +820,135 @@ def get_publication_followers_browser(author_handle: str, limit: int = 100) -> L
         print("Browser not initialized")
         return []
 
-    cache_key = f"followers_browser:{author_handle}:{limit}"
-    cached = cache.get(cache_key)
-    if cached:
-        return [UserProfile(**p) for p in cached]
-
-    _rate_limit()
-
-    # Use fresh page to avoid React routing issues
-    page = _new_stealth_page()
+    cache_key = f"{list_type}_browser:{author_handle}:{limit}"
+    cached = _read_cached_users(cache_key)
+    if cached is not None:
+        return cached
+
+    # Coalesce concurrent fetches: the first caller does the work, the
+    # rest wait on its event and then re-read the cache
+    with _inflight_lock:
+        pending = _inflight.get(cache_key)
+        if pending is None:
+            _inflight[cache_key] = threading.Event()
+    if pending is not None:
+        pending.wait()
+        return _read_cached_users(cache_key) or []
 
-    # Capture API response via interception
-    captured_data: List[Dict] = []
-
-    def handle_response(response):
-        if "subscriber-lists" in response.url and "substack.com/api" in response.url:
-            try:
-                if response.status == 200:
-                    captured_data.append(response.json())
-            except:
-                pass
+    try:
+        profiles = _fetch_subscriber_list(author_handle, list_type, limit)
+        if profiles is None and _headless:
+            # The challenge survived the headless attempt (stealth patches
+            # included); retry once with a real window before giving up
+            if _relaunch_headed():
+                profiles = _fetch_subscriber_list(author_handle, list_type, limit)
+        if profiles is None:
+            cache.set_negative(cache_key)
+            return []
+        # Cache a struct-of-arrays layout; far smaller than per-user dicts
+        cache.set(cache_key, _users_to_soa(profiles), ttl=LIST_CACHE_TTL)
+        return profiles
+    finally:
+        with _inflight_lock:
+            _inflight.pop(cache_key).set()
 
-    page.on("response", handle_response)
 
-    page_url = f"https://substack.com/@{author_handle}/followers"
+def _fetch_subscriber_list(author_handle: str, list_type: str, limit: int) -> Optional[List[UserProfile]]:
+    """Fetch one subscriber/follower list from the live site (no caching)."""
+    _rate_limit()
 
-    try:
-        page.goto(page_url, wait_until="networkidle", timeout=60000)
+    # Capture the subscriber-lists API response the page itself fires
+    captured_data: List[Dict] = []
 
-        # Wait for Cloudflare if needed
-        for _ in range(6):
-            if "Just a moment" in page.content():
-                time.sleep(5)
-            else:
-                break
+    profile_url = f"https://substack.com/@{author_handle}"
 
-        time.sleep(2)  # Wait for API response
+    # Use pooled page to avoid React routing issues on the main page
+    with checkout_page() as page:
+        try:
+            # Wait for the actual API response instead of sleeping fixed
+            # amounts after networkidle
+            with page.expect_response(
+                lambda r: r.url.startswith("https://substack.com/api/v1/user/")
+                and "subscriber-lists" in r.url
+                and r.status == 200,
+                timeout=30000,
+            ) as resp_info:
+                if list_type == "subscribers":
+                    # Navigate to profile first (more human-like)
+                    resp = page.goto(profile_url, wait_until="networkidle", timeout=60000)
+                    time.sleep(random.uniform(1, 2))  # Human-like pause
+
+                    # Click on Subscribers link
+                    try:
+                        subs_link = page.locator("text=Subscribers").first
+                        if subs_link.is_visible():
+                            subs_link.click()
+                        else:
+                            resp = page.goto(f"{profile_url}/subscribers", wait_until="domcontentloaded", timeout=60000)
+                    except:
+                        resp = page.goto(f"{profile_url}/subscribers", wait_until="domcontentloaded", timeout=60000)
+                else:
+                    resp = page.goto(f"{profile_url}/followers", wait_until="domcontentloaded", timeout=60000)
+
+                # Fast path: a challenged navigation answers 403/503, no
+                # need to inspect the document at all
+                if resp and resp.status in (403, 503):
+                    _bucket.decrease_rate()
+
+                # Let any Cloudflare interstitial clear; polling the title
+                # is a few bytes per check, unlike body.innerText
+                try:
+                    page.wait_for_function(
+                        "() => !document.title.includes('Just a moment')",
+                        timeout=30000,
+                    )
+                except Exception:
+                    _bucket.decrease_rate()
+
+            captured_data.append(_json_loads(resp_info.value.body()))
 
-    except:
-        pass
+        except Exception as e:
+            print(f"  Navigation error: {e}")
 
-    page.remove_listener("response", handle_response)
-    page.close()
+    if captured_data:
+        _bucket.increase_rate()
 
     if not captured_data:
         # Try undetected Chrome as fallback (works better with Cloudflare)
         if HAS_UNDETECTED_CHROME:
-            data = _fetch_subscriber_lists_chrome(author_handle, "followers")
+            data = _fetch_subscriber_lists_chrome(author_handle, list_type)
             if data:
                 captured_data = [data]
 
     if not captured_data:
-        return []
+        return None
 
     data = captured_data[0]
 
     if not data:
-        return []
+        print(f"  Could not fetch {list_type} data")
+        return None
 
     # Response structure: { subscriberLists: [{ groups: [{ users: [...] }] }] }
-    followers = []
-    all_users = []
-
-    subscriber_lists = data.get("subscriberLists", [])
-    for sub_list in subscriber_lists:
-        groups = sub_list.get("groups", [])
-        for group in groups:
-            users = group.get("users", [])
-            all_users.extend(users)
-
-    print(f"  Got {len(all_users)} total followers")
-    follower_list = all_users[:limit]
-
-    for f in follower_list:
-        profile = UserProfile(
-            id=f.get("id", 0),
-            username=f.get("handle", f.get("username", "")),
-            name=f.get("name", ""),
-            bio=f.get("bio"),
-            photo_url=f.get("photo_url"),
-            has_publication=bool(f.get("primaryPublication")),
-            publication_url=f.get("primaryPublication", {}).get("url") if f.get("primaryPublication") else None,
-            follower_count=f.get("followerCount", 0),
-        )
-        followers.append(profile)
+    # Consume lazily up to limit instead of materializing every user -
+    # big publications return tens of thousands we'd just slice away
+    groups = [
+        group
+        for sub_list in data.get("subscriberLists", [])
+        for group in sub_list.get("groups", [])
+    ]
+    total = sum(len(group.get("users", ())) for group in groups)
+    print(f"  Got {total} total {list_type}")
+
+    users_iter = (u for group in groups for u in group.get("users", []))
+    return [_user_from_dict(u) for u in islice(users_iter, limit)]
+
+
+def get_publication_subscribers_browser(author_handle: str, limit: int = 100) -> List[UserProfile]:
+    """Get subscribers of a publication by navigating to the subscribers page."""
+    return _get_subscriber_list(author_handle, "subscribers", limit)
 
-    # Cache results
-    cache.set(cache_key, [
-        {
-            "id": p.id,
-            "username": p.username,
-            "name": p.name,
-            "bio": p.bio,
-            "photo_url": p.photo_url,
-            "has_publication": p.has_publication,
-            "publication_url": p.publication_url,
-            "follower_count": p.follower_count,
-        }
-        for p in followers
-    ])
 
-    return followers
+def get_publication_followers_browser(author_handle: str, limit: int = 100) -> List[UserProfile]:
+    """Get followers of a publication by navigating to the followers page."""
+    return _get_subscriber_list(author_handle, "followers", limit)
@@ -0,0 +1,333 @@
+"""Async browser-based Substack client for fetching many authors concurrently.
+
+Mirrors the Playwright path of browser.py but uses playwright.async_api so
+independent per-author subscriber/follower fetches overlap instead of
+serializing behind one page and one global rate limiter. The sync module
+stays the default for single-author flows; this one is driven via
+fetch_publication_lists().
+"""
+
+from __future__ import annotations
+
+import asyncio
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+
+from ._browser_common import (
+    BLOCKED_RESOURCE_TYPES,
+    BLOCKED_URL_SUBSTRINGS,
+    HANDLE_CACHE_TTL,
+    LIST_CACHE_TTL,
+    TokenBucket,
+    _HANDLE_PATTERNS,
+    _find_firefox_profile,
+    _get_browser_cookies,
+    _json_loads,
+)
+from .cache import cache, is_negative
+from .types import UserProfile, _users_from_soa, _users_to_soa
+
+# Browser instance (reused across calls)
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_context: Optional[BrowserContext] = None
+
+# How many author fetches may be in flight at once
+CONCURRENT_FETCHES = 4
+_fetch_semaphore: Optional[asyncio.Semaphore] = None
+
+# Pre-opened tabs, borrowed per fetch - opening a tab per call pays
+# page setup (and re-applied routing) every time; the pool reuses the
+# same few tabs for the whole run, like the sync client's page pool
+_page_pool: Optional[asyncio.Queue] = None
+
+# Rate limiting - async counterpart of browser.TokenBucket
+_rate_lock: Optional[asyncio.Lock] = None
+
+
+class AsyncTokenBucket(TokenBucket):
+    """Token bucket for the asyncio path.
+
+    Same refill arithmetic as the shared TokenBucket, but waiting happens
+    via asyncio.sleep under the rate lock so other fetch tasks keep
+    running while one waits.
+    """
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until the bucket refills if it's empty."""
+        async with _rate_lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= 1
+
+
+_bucket = AsyncTokenBucket()
+
+
+async def _rate_limit(domain: str = "substack.com") -> None:
+    """Ensure we don't exceed rate limits via the shared token bucket."""
+    await _bucket.acquire()
+
+
+async def _block_noncritical(route) -> None:
+    """Route handler that aborts image/font/media/analytics requests."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        d in request.url for d in BLOCKED_URL_SUBSTRINGS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def init_browser_async(concurrency: int = CONCURRENT_FETCHES) -> bool:
+    """
+    Initialize the async browser with cookies from user's existing browser session.
+
+    Args:
+        concurrency: How many author fetches may be in flight at once
+
+    Returns:
+        True if browser initialized successfully
+    """
+    global _playwright, _browser, _context, _fetch_semaphore, _rate_lock, _page_pool
+
+    _playwright = await async_playwright().start()
+    _fetch_semaphore = asyncio.Semaphore(concurrency)
+    _rate_lock = asyncio.Lock()
+
+    cookies, _ = _get_browser_cookies()
+    if not cookies:
+        print("Could not get cookies from any browser.")
+        print("Make sure you're logged into Substack in Firefox, Chrome, or Safari.")
+        return False
+
+    _browser = await _playwright.firefox.launch(headless=False)
+    _context = await _browser.new_context(
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:146.0) Gecko/20100101 Firefox/146.0",
+        viewport={"width": 1280, "height": 720},
+    )
+    # Skip images/fonts/trackers - networkidle waits for all of them
+    await _context.route("**/*", _block_noncritical)
+    await _context.add_cookies(list(cookies))
+
+    # One tab per concurrent fetch; the semaphore bounds demand to match
+    _page_pool = asyncio.Queue()
+    for _ in range(concurrency):
+        _page_pool.put_nowait(await _context.new_page())
+
+    print("Async browser initialized with session cookies.")
+    return True
+
+
+async def close_browser_async() -> None:
+    """Close the async browser."""
+    global _playwright, _browser, _context, _page_pool
+    _page_pool = None  # pages die with the context
+    if _context:
+        await _context.close()
+    if _browser:
+        await _browser.close()
+    if _playwright:
+        await _playwright.stop()
+    _playwright = None
+    _browser = None
+    _context = None
+
+
+def _parse_subscriber_lists(data: Dict, limit: int) -> List[UserProfile]:
+    """Parse a subscriber-lists API response into UserProfile objects."""
+    # Response structure: { subscriberLists: [{ groups: [{ users: [...] }] }] }
+    # Consume lazily up to limit instead of materializing every user
+    users_iter = (
+        u
+        for sub_list in data.get("subscriberLists", [])
+        for group in sub_list.get("groups", [])
+        for u in group.get("users", [])
+    )
+
+    profiles = []
+    for u in islice(users_iter, limit):
+        # Bind primaryPublication once instead of three chained lookups
+        primary_pub = u.get("primaryPublication")
+        profiles.append(UserProfile(
+            id=u.get("id", 0),
+            username=u.get("handle") or u.get("username", ""),
+            name=u.get("name", ""),
+            bio=u.get("bio"),
+            photo_url=u.get("photo_url"),
+            has_publication=primary_pub is not None,
+            publication_url=primary_pub.get("url") if primary_pub else None,
+            follower_count=u.get("followerCount", 0),
+        ))
+    return profiles
+
+
+async def _fetch_list(author_handle: str, list_type: str, limit: int) -> List[UserProfile]:
+    """Fetch one subscriber/follower list on its own page."""
+    cache_key = f"{list_type}_browser:{author_handle}:{limit}"
+    cached = cache.get(cache_key)
+    if cached:
+        # The sync client negative-caches failed fetches under the same
+        # keys; the sentinel is a dict, so check it before the SoA branch
+        if is_negative(cached):
+            return []
+        # SoA dict from current code; entries written before the layout
+        # change are still lists of per-user dicts
+        if isinstance(cached, dict):
+            return _users_from_soa(cached)
+        return [UserProfile(**p) for p in cached]
+
+    await _rate_limit()
+
+    page = await _page_pool.get()
+    captured_data: List[Dict] = []
+
+    def handle_response(response):
+        # Keep this callback cheap - it runs on the event dispatch path for
+        # every response. Match precisely, stash the response object only,
+        # and ignore everything after the first hit; the body is parsed
+        # once navigation settles.
+        if captured_data:
+            return
+        if (
+            response.url.startswith("https://substack.com/api/v1/user/")
+            and "subscriber-lists" in response.url
+            and response.status == 200
+        ):
+            captured_data.append(response)
+
+    page.on("response", handle_response)
+
+    try:
+        await page.goto(
+            f"https://substack.com/@{author_handle}/{list_type}",
+            wait_until="networkidle",
+            timeout=60000,
+        )
+
+        # Wait out any Cloudflare challenge with a single event-driven
+        # wait instead of re-serializing the whole DOM every 5s
+        try:
+            await page.wait_for_selector("text=Just a moment", state="detached", timeout=30000)
+        except Exception:
+            pass
+
+        await asyncio.sleep(2)  # Wait for API response
+    except Exception:
+        pass
+
+    page.remove_listener("response", handle_response)
+
+    data = None
+    if captured_data:
+        try:
+            data = _json_loads(await captured_data[0].body())
+        except Exception:
+            data = None
+    await _page_pool.put(page)
+
+    if not data:
+        return []
+
+    profiles = _parse_subscriber_lists(data, limit)
+
+    # Cache a struct-of-arrays layout; far smaller than per-user dicts
+    cache.set(cache_key, _users_to_soa(profiles), ttl=LIST_CACHE_TTL)
+
+    return profiles
+
+
+async def resolve_author_handle(subdomain: str) -> Optional[str]:
+    """Resolve a publication subdomain to its author handle on its own page."""
+    cache_key = f"handle:{subdomain}"
+    cached = cache.get(cache_key)
+    if cached:
+        return cached
+
+    async with _fetch_semaphore:
+        await _rate_limit()
+
+        page = await _page_pool.get()
+        try:
+            await page.goto(
+                f"https://{subdomain}.substack.com",
+                wait_until="domcontentloaded",
+                timeout=30000,
+            )
+            try:
+                await page.wait_for_selector("text=Just a moment", state="detached", timeout=30000)
+            except Exception:
+                pass
+
+            content = await page.content()
+            for pattern in _HANDLE_PATTERNS:
+                match = pattern.search(content)
+                if match:
+                    cache.set(cache_key, match.group(1), ttl=HANDLE_CACHE_TTL)
+                    return match.group(1)
+        except Exception as e:
+            print(f"  Error getting author handle for {subdomain}: {e}")
+        finally:
+            await _page_pool.put(page)
+
+    return None
+
+
+async def resolve_author_handles(subdomains: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Resolve many subdomains to author handles concurrently.
+
+    Handle resolution is one navigation per newsletter and dominates the
+    followers/subscribers workflow when done serially; the semaphore keeps
+    at most CONCURRENT_FETCHES pages navigating at once.
+    """
+    results = await asyncio.gather(
+        *(resolve_author_handle(s) for s in subdomains),
+        return_exceptions=True,
+    )
+    return {
+        subdomain: result if not isinstance(result, Exception) else None
+        for subdomain, result in zip(subdomains, results)
+    }
+
+
+async def fetch_author_lists(author_handle: str, limit: int = 100) -> Tuple[List[UserProfile], List[UserProfile]]:
+    """Fetch an author's subscribers and followers under the shared semaphore."""
+    async with _fetch_semaphore:
+        subscribers = await _fetch_list(author_handle, "subscribers", limit)
+        followers = await _fetch_list(author_handle, "followers", limit)
+        return subscribers, followers
+
+
+async def fetch_publication_lists(
+    author_handles: List[str],
+    limit: int = 100,
+) -> Dict[str, Tuple[List[UserProfile], List[UserProfile]]]:
+    """
+    Fetch subscriber and follower lists for many authors concurrently.
+
+    Args:
+        author_handles: Author handles to fetch
+        limit: Maximum users to keep per list
+
+    Returns:
+        Dict mapping author handle -> (subscribers, followers)
+    """
+    results = await asyncio.gather(
+        *(fetch_author_lists(h, limit) for h in author_handles),
+        return_exceptions=True,
+    )
+
+    out: Dict[str, Tuple[List[UserProfile], List[UserProfile]]] = {}
+    for handle, result in zip(author_handles, results):
+        if isinstance(result, Exception):
+            print(f"  Error fetching lists for @{handle}: {result}")
+            out[handle] = ([], [])
+        else:
+            out[handle] = result
+    return out
@@ -2,65 +2,245 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+# orjson encodes/decodes 3-5x faster than stdlib json; fall back silently
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
 
 CACHE_DIR = Path.home() / ".cache" / "substack-friend-finder"
-CACHE_FILE = CACHE_DIR / "cache.json"
+CACHE_FILE = CACHE_DIR / "cache.jsonl"
+LEGACY_CACHE_FILE = CACHE_DIR / "cache.json"
 DEFAULT_TTL = 86400  # 24 hours
+NEGATIVE_TTL = 300  # 5 minutes - failed lookups are retried sooner
+MAX_ENTRIES = 10_000  # LRU-evict beyond this, bounding memory and file size
+
+# Compact the log once it holds this many times more lines than live keys
+COMPACT_RATIO = 2
+
+# Seconds between background expiry sweeps
+PRUNE_INTERVAL = 300
+
+# Sentinel stored for failed lookups so they aren't refetched immediately
+_MISS_SENTINEL = {"__miss__": True}
+
+
+def is_negative(value: Any) -> bool:
+    """Check whether a cached value is a negative (cached-failure) entry."""
+    return isinstance(value, dict) and value.get("__miss__") is True
 
 
 class Cache:
-    """Simple JSON file cache."""
+    """JSON-lines file cache.
 
-    def __init__(self, ttl: int = DEFAULT_TTL):
+    Writes append one line per set() instead of rewriting the whole file,
+    so caching N entries costs O(N) bytes of disk I/O rather than O(N^2).
+    The log is compacted (rewritten with only live keys) when it grows past
+    COMPACT_RATIO times the number of keys.
+
+    Entries are kept in LRU order and capped at max_entries, so a run that
+    inspects thousands of subscribers can't grow the cache without bound.
+    """
+
+    def __init__(self, ttl: int = DEFAULT_TTL, max_entries: int = MAX_ENTRIES):
         self.ttl = ttl
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self.max_entries = max_entries
+        self.disabled = False  # --no-cache sets this; reads miss, writes drop
+        # One re-entrant lock over _cache/_log - the prune timer thread and
+        # thread-pool workers share this instance, and an unguarded
+        # compact() closes the log under a concurrent _append
+        self._lock = threading.RLock()
+        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._log = None  # append handle, opened on first write
+        self._log_lines = 0
         self._load()
+        self._prune()
+        self._schedule_prune()
+        atexit.register(self.close)
 
     def _load(self) -> None:
-        """Load cache from disk."""
+        """Load cache from disk, merging log lines last-write-wins."""
         if CACHE_FILE.exists():
             try:
-                with open(CACHE_FILE, "r") as f:
-                    self._cache = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self._cache = {}
+                with open(CACHE_FILE, "rb") as f:
+                    for line in f:
+                        try:
+                            record = _loads(line)
+                        except ValueError:
+                            continue  # torn line from an interrupted write
+                        self._cache[record["k"]] = {
+                            "value": record["v"],
+                            "expires": record["e"],
+                        }
+                        self._log_lines += 1
+            except IOError:
+                self._cache = OrderedDict()
+        elif LEGACY_CACHE_FILE.exists():
+            # Migrate the old whole-file cache.json in place
+            try:
+                with open(LEGACY_CACHE_FILE, "rb") as f:
+                    self._cache = OrderedDict(_loads(f.read()))
+            except (ValueError, IOError):
+                self._cache = OrderedDict()
+            if self._cache:
+                # Write the migrated entries to the new log now - once
+                # cache.jsonl exists this branch is never taken again, so
+                # anything not persisted here is lost on the next run
+                self.compact()
+
+    def _prune(self) -> None:
+        """Drop expired entries in one sweep, compacting if any were found."""
+        with self._lock:
+            now = time.time()
+            expired = [key for key, entry in self._cache.items() if now > entry.get("expires", 0)]
+            for key in expired:
+                del self._cache[key]
+            if expired and self._log_lines > len(self._cache):
+                self.compact()
+
+    def _schedule_prune(self) -> None:
+        """Re-arm the background sweep; a daemon timer won't block exit."""
+        timer = threading.Timer(PRUNE_INTERVAL, self._prune_and_reschedule)
+        timer.daemon = True
+        timer.start()
+
+    def _prune_and_reschedule(self) -> None:
+        self._prune()
+        self._schedule_prune()
 
-    def _save(self) -> None:
-        """Save cache to disk."""
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CACHE_FILE, "w") as f:
-            json.dump(self._cache, f, indent=2)
+    def _append(self, key: str, entry: Dict[str, Any]) -> None:
+        """Append one record to the log, opening it lazily."""
+        if self._log is None:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._log = open(CACHE_FILE, "ab", buffering=0)  # unbuffered
+        self._log.write(
+            _dumps({"k": key, "v": entry["value"], "e": entry["expires"]}) + b"\n"
+        )
+        self._log_lines += 1
+
+    def compact(self) -> None:
+        """Rewrite the log with one line per live key."""
+        with self._lock:
+            self.close()
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = CACHE_FILE.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                for key, entry in self._cache.items():
+                    f.write(
+                        _dumps({"k": key, "v": entry["value"], "e": entry["expires"]}) + b"\n"
+                    )
+            os.replace(tmp, CACHE_FILE)
+            self._log_lines = len(self._cache)
 
     def get(self, key: str) -> Optional[Any]:
         """Get a value from cache if it exists and hasn't expired."""
-        if key not in self._cache:
-            return None
+        with self._lock:
+            if self.disabled or key not in self._cache:
+                return None
 
-        entry = self._cache[key]
-        if time.time() > entry.get("expires", 0):
-            del self._cache[key]
-            return None
+            entry = self._cache[key]
+            if time.time() > entry.get("expires", 0):
+                # Leave removal to the pruner; get() stays a pure read
+                return None
 
-        return entry.get("value")
+            self._cache.move_to_end(key)
+            return entry.get("value")
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set a value in cache with optional custom TTL."""
-        self._cache[key] = {
-            "value": value,
-            "expires": time.time() + (ttl or self.ttl),
-        }
-        self._save()
+        if self.disabled:
+            return
+        with self._lock:
+            entry = {
+                "value": value,
+                "expires": time.time() + (ttl or self.ttl),
+            }
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            self._append(key, entry)
+
+            # Evict least-recently-used entries past the cap; they drop out of
+            # the file at the next compaction
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+            # Gate on log size, not key count - a small cache with a hot key
+            # would otherwise grow the log forever without ever compacting
+            if self._log_lines > max(64, COMPACT_RATIO * len(self._cache)):
+                self.compact()
+
+    def mget(self, keys: List[str]) -> Dict[str, Any]:
+        """Get many keys in one call, returning only the live hits."""
+        with self._lock:
+            out = {}
+            for key in keys:
+                value = self.get(key)
+                if value is not None:
+                    out[key] = value
+            return out
+
+    def mset(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set many keys in one call, appending one batched log write."""
+        if self.disabled or not items:
+            return
+        with self._lock:
+            expires = time.time() + (ttl or self.ttl)
+
+            if self._log is None:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                self._log = open(CACHE_FILE, "ab", buffering=0)  # unbuffered
+
+            # One write() for the whole batch - the log is unbuffered, so
+            # per-key appends would cost a syscall each
+            lines = []
+            for key, value in items.items():
+                entry = {"value": value, "expires": expires}
+                self._cache[key] = entry
+                self._cache.move_to_end(key)
+                lines.append(_dumps({"k": key, "v": value, "e": expires}))
+            lines.append(b"")
+            self._log.write(b"\n".join(lines))
+            self._log_lines += len(items)
+
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+            # Gate on log size, not key count - a small cache with a hot key
+            # would otherwise grow the log forever without ever compacting
+            if self._log_lines > max(64, COMPACT_RATIO * len(self._cache)):
+                self.compact()
+
+    def set_negative(self, key: str, ttl: int = NEGATIVE_TTL) -> None:
+        """Cache a failed lookup briefly so callers don't hammer it."""
+        self.set(key, _MISS_SENTINEL, ttl=ttl)
+
+    def close(self) -> None:
+        """Flush and close the log handle (reopened on the next write)."""
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
 
     def clear(self) -> None:
         """Clear all cached data."""
-        self._cache = {}
-        if CACHE_FILE.exists():
-            CACHE_FILE.unlink()
+        with self._lock:
+            self._cache = OrderedDict()
+            self._log_lines = 0
+            self.close()
+            if CACHE_FILE.exists():
+                CACHE_FILE.unlink()
 
 
 # Global cache instance
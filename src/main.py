@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import logging
 import sys
-from typing import Dict, List, Tuple
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
 
 from . import output
 from . import substack_client as client
-from .browser import init_browser, get_publication_subscribers_browser, get_publication_followers_browser, close_browser
+from .browser import init_browser, get_publication_subscribers_browser, get_publication_followers_browser, close_browser, _get_author_handle
+from .browser_async import close_browser_async, fetch_publication_lists, init_browser_async, resolve_author_handles
+from .cache import cache
 from .scoring import score_by_appearances
 from .types import Newsletter, UserProfile
 
@@ -22,6 +27,7 @@ def find_friends(
     require_publication: bool = False,
     limit: int = 20,
     output_file: str = None,
+    concurrency: int = 4,
 ) -> None:
     """
     Find friends based on Substack subscription overlap.
@@ -39,14 +45,21 @@ def find_friends(
         require_publication: Only show users with their own publication
         limit: Maximum number of matches to display
         output_file: Optional file path to save results
+        concurrency: Newsletters to scan in parallel (1 = sequential browser)
     """
     output.print_header(username)
 
-    # Initialize browser for authenticated API access
-    output.print_progress("Initializing browser...")
-    if not init_browser():
-        output.print_error("Failed to initialize browser. Make sure you're logged into Substack in Firefox/Chrome.")
-        return
+    # The scan is network bound, so newsletters are fetched concurrently
+    # through the async client by default; --concurrency 1 falls back to
+    # the sequential client with its persistent-profile/Chrome fallbacks
+    use_async = concurrency > 1
+
+    if not use_async:
+        # Initialize browser for authenticated API access
+        output.print_progress("Initializing browser...")
+        if not init_browser():
+            output.print_error("Failed to initialize browser. Make sure you're logged into Substack in Firefox/Chrome.")
+            return
 
     try:
         # Step 1: Get the input user's profile
@@ -85,48 +98,41 @@ def find_friends(
         person_appearances: Dict[int, Tuple[UserProfile, List[Newsletter]]] = {}
         newsletters_scanned = 0
 
-        for i, newsletter in enumerate(newsletters_to_scan, 1):
+        # Hoist the input-user check out of the per-person loop; a
+        # frozenset probe beats two attribute loads and a compare
+        skip_ids = frozenset({input_profile.id}) if input_profile else frozenset()
+
+        if use_async:
             output.print_progress(
-                f"  [{i}/{len(newsletters_to_scan)}] {newsletter.name} ({newsletter.subscriber_count:,} subs)"
+                f"  Fetching {len(newsletters_to_scan)} newsletters ({concurrency} at a time)..."
             )
-
-            # Get author handle first (needed for both subscribers and followers)
-            from .browser import _get_author_handle
-            author_handle = _get_author_handle(newsletter.subdomain) if newsletter.subdomain else None
-
-            if not author_handle:
-                output.print_progress(f"    Could not find author handle, skipping...")
+            fetched = asyncio.run(_scan_newsletters_async(
+                newsletters_to_scan, subscribers_per_newsletter, concurrency,
+            ))
+            if fetched is None:
+                output.print_error("Failed to initialize browser. Make sure you're logged into Substack in Firefox/Chrome.")
+                return
+        else:
+            fetched = _scan_newsletters_serial(newsletters_to_scan, subscribers_per_newsletter)
+
+        for i, (newsletter, subscribers, followers) in enumerate(fetched, 1):
+            if subscribers is None:
+                output.print_progress(f"    Could not find author handle for {newsletter.name}, skipping...")
                 newsletters_scanned += 1
                 continue
 
-            # Get subscribers of this newsletter via browser
-            subscribers = get_publication_subscribers_browser(
-                author_handle,
-                limit=subscribers_per_newsletter,
-            )
-
-            # Get followers of this newsletter via browser
-            followers = get_publication_followers_browser(
-                author_handle,
-                limit=subscribers_per_newsletter,
-            )
-
-            # Combine subscribers and followers (avoiding duplicates)
-            seen_ids = set()
-            combined = []
-            for person in subscribers + followers:
-                if person.id not in seen_ids:
-                    seen_ids.add(person.id)
-                    combined.append(person)
+            # Combine subscribers and followers, deduplicating by ID - the
+            # dict insert runs in C and keeps first-seen order
+            combined = list({p.id: p for p in chain(subscribers, followers)}.values())
 
             output.print_progress(
-                f"    Found {len(combined)} unique people ({len(subscribers)} subs + {len(followers)} followers)"
+                f"    {newsletter.name}: {len(combined)} unique people ({len(subscribers)} subs + {len(followers)} followers)"
             )
 
             # Track which newsletters each person appears in
             for person in combined:
                 # Skip the input user
-                if input_profile and person.id == input_profile.id:
+                if person.id in skip_ids:
                     continue
 
                 if person.id not in person_appearances:
@@ -137,6 +143,19 @@ def find_friends(
 
             newsletters_scanned += 1
 
+            # Drop candidates that can't reach min_overlap even if they
+            # appear in every remaining newsletter - keeps the working
+            # set bounded instead of carrying one-off people to the end
+            remaining = len(fetched) - i
+            if min_overlap > 1:
+                doomed = [
+                    user_id
+                    for user_id, (_, appearances) in person_appearances.items()
+                    if len(appearances) + remaining < min_overlap
+                ]
+                for user_id in doomed:
+                    del person_appearances[user_id]
+
         # ============================================================
         # PHASE 2: SCORING
         # Score candidates by newsletters they appear in (no API calls!)
@@ -144,11 +163,13 @@ def find_friends(
 
         output.print_progress(f"\nScoring {len(person_appearances)} unique candidates...")
 
+        # Top-K select in the scorer unless the full list is being saved
         matches = score_by_appearances(
             candidates=person_appearances,
             min_overlap=min_overlap,
             require_bio=require_bio,
             require_publication=require_publication,
+            limit=None if output_file else limit,
         )
 
         # Step 6: Output results
@@ -168,7 +189,92 @@ def find_friends(
             output.print_progress(f"\nResults saved to {output_file}")
 
     finally:
-        close_browser()
+        if not use_async:
+            close_browser()
+
+
+def _scan_newsletters_serial(
+    newsletters: List[Newsletter],
+    subscribers_per_newsletter: int,
+) -> List[Tuple[Newsletter, Optional[List[UserProfile]], Optional[List[UserProfile]]]]:
+    """
+    Fetch each newsletter's subscriber and follower lists one at a time.
+
+    Returns (newsletter, subscribers, followers) tuples; (newsletter, None,
+    None) marks a newsletter whose author handle couldn't be resolved.
+    """
+    results = []
+
+    for i, newsletter in enumerate(newsletters, 1):
+        output.print_progress(
+            f"  [{i}/{len(newsletters)}] {newsletter.name} ({newsletter.subscriber_count:,} subs)"
+        )
+
+        # Get author handle first (needed for both subscribers and followers)
+        author_handle = _get_author_handle(newsletter.subdomain) if newsletter.subdomain else None
+
+        if not author_handle:
+            results.append((newsletter, None, None))
+            continue
+
+        # Get subscribers of this newsletter via browser
+        subscribers = get_publication_subscribers_browser(
+            author_handle,
+            limit=subscribers_per_newsletter,
+        )
+
+        # Get followers of this newsletter via browser
+        followers = get_publication_followers_browser(
+            author_handle,
+            limit=subscribers_per_newsletter,
+        )
+
+        results.append((newsletter, subscribers, followers))
+
+    return results
+
+
+async def _scan_newsletters_async(
+    newsletters: List[Newsletter],
+    subscribers_per_newsletter: int,
+    concurrency: int,
+) -> Optional[List[Tuple[Newsletter, Optional[List[UserProfile]], Optional[List[UserProfile]]]]]:
+    """
+    Fetch every newsletter's subscriber and follower lists concurrently.
+
+    The scan is dominated by network round-trips, so handle resolution and
+    the list fetches all go through the async client, which overlaps up to
+    `concurrency` page navigations at once.
+
+    Returns None if the async browser could not be initialized.
+    """
+    if not await init_browser_async(concurrency):
+        return None
+
+    try:
+        handles = await resolve_author_handles(
+            [n.subdomain for n in newsletters if n.subdomain]
+        )
+
+        author_handles = []
+        for newsletter in newsletters:
+            handle = handles.get(newsletter.subdomain)
+            if handle and handle not in author_handles:
+                author_handles.append(handle)
+
+        lists = await fetch_publication_lists(author_handles, limit=subscribers_per_newsletter)
+
+        results = []
+        for newsletter in newsletters:
+            handle = handles.get(newsletter.subdomain)
+            if not handle:
+                results.append((newsletter, None, None))
+            else:
+                subscribers, followers = lists.get(handle, ([], []))
+                results.append((newsletter, subscribers, followers))
+        return results
+    finally:
+        await close_browser_async()
 
 
 def save_results_to_file(
@@ -179,39 +285,48 @@ def save_results_to_file(
     num_scanned: int,
 ) -> None:
     """Save match results to a text file."""
-    with open(filepath, "w") as f:
-        f.write(f"Substack Friend Finder Results for @{username}\n")
-        f.write(f"=" * 50 + "\n\n")
-        f.write(f"User's subscriptions: {num_subs}\n")
-        f.write(f"Newsletters scanned: {num_scanned}\n")
-        f.write(f"Total matches: {len(matches)}\n\n")
-        f.write("-" * 50 + "\n\n")
-
-        for i, match in enumerate(matches, 1):
-            user = match.user
-            f.write(f"#{i} {user.name or user.username}")
-            if user.username:
-                f.write(f" (@{user.username})")
-            f.write(f"\n")
-            f.write(f"   Score: {match.score:.2f}\n")
-            f.write(f"   Profile: https://substack.com/@{user.username}\n")
-
-            if user.has_publication and user.publication_url:
-                f.write(f"   Publication: {user.publication_url}\n")
-
-            shared_names = [n.name for n in match.shared_newsletters]
-            f.write(f"   Shared ({len(shared_names)}): {', '.join(shared_names)}\n")
-
-            if user.bio:
-                bio_short = user.bio[:150] + "..." if len(user.bio) > 150 else user.bio
-                bio_short = bio_short.replace("\n", " ")
-                f.write(f"   Bio: {bio_short}\n")
-
-            f.write("\n")
+    # Collect everything and write once - thousands of matches would
+    # otherwise mean ~10 buffered-write calls each
+    chunks = [
+        f"Substack Friend Finder Results for @{username}\n",
+        "=" * 50 + "\n\n",
+        f"User's subscriptions: {num_subs}\n",
+        f"Newsletters scanned: {num_scanned}\n",
+        f"Total matches: {len(matches)}\n\n",
+        "-" * 50 + "\n\n",
+    ]
+
+    for i, match in enumerate(matches, 1):
+        user = match.user
+        chunks.append(f"#{i} {user.name or user.username}")
+        if user.username:
+            chunks.append(f" (@{user.username})")
+        chunks.append("\n")
+        chunks.append(f"   Score: {match.score:.2f}\n")
+        chunks.append(f"   Profile: https://substack.com/@{user.username}\n")
+
+        if user.has_publication and user.publication_url:
+            chunks.append(f"   Publication: {user.publication_url}\n")
+
+        shared_names = [n.name for n in match.shared_newsletters]
+        chunks.append(f"   Shared ({len(shared_names)}): {', '.join(shared_names)}\n")
+
+        if user.bio:
+            bio_short = user.bio[:150] + "..." if len(user.bio) > 150 else user.bio
+            bio_short = bio_short.replace("\n", " ")
+            chunks.append(f"   Bio: {bio_short}\n")
+
+        chunks.append("\n")
+
+    with open(filepath, "w", buffering=1 << 16) as f:
+        f.writelines(chunks)
 
 
 def main() -> None:
     """CLI entry point."""
+    # Library modules log through logging; surface their warnings here
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+
     parser = argparse.ArgumentParser(
         description="Find friends based on Substack subscription overlap",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -266,9 +381,30 @@ Examples:
         type=str,
         help="Save results to file",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Newsletters to scan in parallel; 1 uses the sequential browser (default: 4)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the disk cache and refetch everything",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        help="Default cache TTL in seconds (default: 86400)",
+    )
 
     args = parser.parse_args()
 
+    if args.no_cache:
+        cache.disabled = True
+    if args.cache_ttl:
+        cache.ttl = args.cache_ttl
+
     try:
         find_friends(
             username=args.username,
@@ -279,6 +415,7 @@ Examples:
             require_publication=args.require_publication,
             limit=args.limit,
             output_file=args.output,
+            concurrency=args.concurrency,
         )
     except KeyboardInterrupt:
         output.console.print("\n[yellow]Interrupted by user[/yellow]")
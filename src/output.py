@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import List
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -47,6 +47,14 @@ def print_matches(matches: List[Match], limit: int = 20) -> None:
 
     console.print(f"\n[bold green]Found {len(matches)} matches![/bold green]\n")
 
+    # Compose all panels and render once - console.print flushes stdout
+    # per call, which adds up at two calls per match
+    renderables = []
+
+    # When piping to a file there's no box drawing to do; plain text
+    # skips Rich's panel layout entirely
+    plain = not console.is_terminal
+
     for i, match in enumerate(matches[:limit], 1):
         # Build the match display
         user = match.user
@@ -67,12 +75,12 @@ def print_matches(matches: List[Match], limit: int = 20) -> None:
         if badges:
             score_text += " | " + " ".join(badges)
 
-        # Shared newsletters
-        shared_text = "[dim]Shared:[/dim] "
-        shared_names = [n.name for n in match.shared_newsletters[:5]]
-        shared_text += ", ".join(shared_names)
-        if len(match.shared_newsletters) > 5:
-            shared_text += f" [dim](+{len(match.shared_newsletters) - 5} more)[/dim]"
+        # Shared newsletters - bind and measure the list once
+        shared = match.shared_newsletters
+        n_shared = len(shared)
+        shared_text = "[dim]Shared:[/dim] " + ", ".join(n.name for n in shared[:5])
+        if n_shared > 5:
+            shared_text += f" [dim](+{n_shared - 5} more)[/dim]"
 
         # Bio snippet
         bio_text = ""
@@ -91,14 +99,19 @@ def print_matches(matches: List[Match], limit: int = 20) -> None:
         if profile_url:
             content += f"\n[blue]Profile:[/blue] {profile_url}"
 
-        console.print(Panel(
-            content,
-            title=header,
-            title_align="left",
-            border_style="blue" if user.has_publication else "white",
-            expand=False,
-        ))
-        console.print()
+        if plain:
+            renderables.append(f"{header}\n{content}")
+        else:
+            renderables.append(Panel(
+                content,
+                title=header,
+                title_align="left",
+                border_style="blue" if user.has_publication else "white",
+                expand=False,
+            ))
+        renderables.append("")
+
+    console.print(Group(*renderables))
 
 
 def print_summary(
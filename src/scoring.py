@@ -2,12 +2,40 @@
 
 from __future__ import annotations
 
+import heapq
 import math
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Optional, Tuple
 
 from .types import Match, Newsletter, UserProfile
 
+# NumPy vectorizes the scoring math for large candidate pools; the
+# pure-Python path handles small pools and missing installs
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
+# Below this many candidates the array setup costs more than it saves
+NUMPY_MIN_CANDIDATES = 100
+
+
+def _top_matches(matches: List[Match], limit: Optional[int]) -> List[Match]:
+    """
+    Order matches by score descending.
+
+    With a limit, heapq.nlargest does an O(n log k) partial selection
+    instead of fully sorting thousands of matches to display twenty.
+    """
+    if limit is not None:
+        return heapq.nlargest(limit, matches, key=attrgetter("score"))
+    matches.sort(key=attrgetter("score"), reverse=True)
+    return matches
+
+
+@lru_cache(maxsize=None)
 def compute_nicheness_weight(subscriber_count: int) -> float:
     """
     Compute the nicheness weight for a newsletter.
@@ -20,11 +48,82 @@ def compute_nicheness_weight(subscriber_count: int) -> float:
         - 1,000 subscribers: ~0.33
         - 10,000 subscribers: ~0.25
         - 1,000,000 subscribers: ~0.17
+
+    Memoized: only a handful of distinct subscriber counts show up per run
+    (one per scanned newsletter), so repeat calls in the scoring loops are
+    dict lookups rather than math.log calls.
     """
     # Add 2 to avoid log(0) and log(1) issues
     return 1.0 / math.log(subscriber_count + 2)
 
 
+# Bloom filter over newsletter IDs: 1024 bits in one int, two probes per
+# ID. Most candidates share nothing with the input user, and an empty
+# AND rejects them before any per-subscription dict probing
+_BLOOM_BITS = 1024
+_BLOOM_SEED_A = 0x9E3779B1
+_BLOOM_SEED_B = 0x85EBCA6B
+
+
+def _bloom_of_ids(ids) -> int:
+    """Pack newsletter IDs into an int-backed Bloom filter."""
+    bits = 0
+    for i in ids:
+        bits |= 1 << (i * _BLOOM_SEED_A % _BLOOM_BITS)
+        bits |= 1 << (i * _BLOOM_SEED_B % _BLOOM_BITS)
+    return bits
+
+
+def _precompute_user_subs(
+    user_subs: List[Newsletter],
+) -> Tuple[dict, List[float], List[Newsletter]]:
+    """
+    Build the per-input-user lookup structures used by overlap scoring.
+
+    Only the input user's S newsletters can ever be shared, so each gets a
+    bit position 0..S-1, with parallel weight and Newsletter arrays indexed
+    by position. A candidate's shared set is then just an S-bit int, and
+    these structures are built once instead of per comparison.
+    """
+    bit_of = {s.id: i for i, s in enumerate(user_subs)}
+    weights = [compute_nicheness_weight(s.subscriber_count) for s in user_subs]
+    return bit_of, weights, list(user_subs)
+
+
+def _overlap_with_precomputed(
+    bit_of: dict,
+    weights: List[float],
+    newsletters: List[Newsletter],
+    candidate_subs: List[Newsletter],
+) -> Tuple[float, List[Newsletter]]:
+    """Overlap score for one candidate against precomputed input-user structures."""
+    # Pack the candidate's shared subscriptions into a bitmap; misses cost
+    # one hash probe each and duplicates OR away for free
+    bits = 0
+    for sub in candidate_subs:
+        pos = bit_of.get(sub.id)
+        if pos is not None:
+            bits |= 1 << pos
+
+    if not bits:
+        return 0.0, []
+
+    # Walk the set bits (lowest first), summing precomputed weights
+    score = 0.0
+    shared_newsletters = []
+    while bits:
+        lsb = bits & -bits
+        pos = lsb.bit_length() - 1
+        score += weights[pos]
+        shared_newsletters.append(newsletters[pos])
+        bits ^= lsb
+
+    # Sort shared newsletters by nicheness (smallest subscriber count first)
+    shared_newsletters.sort(key=lambda n: n.subscriber_count)
+
+    return score, shared_newsletters
+
+
 def compute_overlap_score(
     user_subs: List[Newsletter],
     candidate_subs: List[Newsletter],
@@ -39,30 +138,8 @@ def compute_overlap_score(
     Returns:
         Tuple of (score, list of shared newsletters sorted by nicheness)
     """
-    # Build sets of subscription IDs for fast lookup
-    user_sub_ids = {s.id for s in user_subs}
-    candidate_sub_ids = {s.id for s in candidate_subs}
-
-    # Find shared subscriptions
-    shared_ids = user_sub_ids & candidate_sub_ids
-
-    if not shared_ids:
-        return 0.0, []
-
-    # Get the Newsletter objects for shared subscriptions
-    user_subs_by_id = {s.id: s for s in user_subs}
-    shared_newsletters = [user_subs_by_id[sid] for sid in shared_ids if sid in user_subs_by_id]
-
-    # Compute score: sum of nicheness weights
-    score = sum(
-        compute_nicheness_weight(n.subscriber_count)
-        for n in shared_newsletters
-    )
-
-    # Sort shared newsletters by nicheness (smallest subscriber count first)
-    shared_newsletters.sort(key=lambda n: n.subscriber_count)
-
-    return score, shared_newsletters
+    bit_of, weights, newsletters = _precompute_user_subs(user_subs)
+    return _overlap_with_precomputed(bit_of, weights, newsletters, candidate_subs)
 
 
 def compute_quality_score(profile: UserProfile) -> float:
@@ -96,6 +173,7 @@ def rank_matches(
     min_overlap: int = 1,
     require_bio: bool = False,
     require_publication: bool = False,
+    limit: Optional[int] = None,
 ) -> List[Match]:
     """
     Rank candidate users by overlap score with quality filtering.
@@ -106,12 +184,23 @@ def rank_matches(
         min_overlap: Minimum number of shared subscriptions required
         require_bio: Only include users with a bio
         require_publication: Only include users with their own publication
+        limit: Keep only the top-limit matches (None keeps all)
 
     Returns:
         List of Match objects sorted by score (highest first)
     """
+    if HAS_NUMPY and len(candidates) >= NUMPY_MIN_CANDIDATES:
+        return _rank_matches_numpy(
+            input_user_subs, candidates, min_overlap, require_bio, require_publication,
+            limit,
+        )
+
     matches = []
 
+    # Build the input-user lookup structures once, not per candidate
+    bit_of, weights, newsletters = _precompute_user_subs(input_user_subs)
+    input_bloom = _bloom_of_ids(bit_of)
+
     for profile, subs in candidates:
         # Apply quality filters
         if require_bio and not profile.bio:
@@ -119,8 +208,13 @@ def rank_matches(
         if require_publication and not profile.has_publication:
             continue
 
+        # Bloom reject: no bits in common means no shared subscription;
+        # false positives just fall through to the exact check
+        if not (input_bloom & _bloom_of_ids(s.id for s in subs)):
+            continue
+
         # Compute overlap
-        score, shared = compute_overlap_score(input_user_subs, subs)
+        score, shared = _overlap_with_precomputed(bit_of, weights, newsletters, subs)
 
         # Apply minimum overlap filter
         if len(shared) < min_overlap:
@@ -136,10 +230,66 @@ def rank_matches(
             shared_newsletters=shared,
         ))
 
-    # Sort by score (descending)
-    matches.sort()
+    # Sort by score (descending), or top-K select when limited
+    return _top_matches(matches, limit)
 
-    return matches
+
+def _rank_matches_numpy(
+    input_user_subs: List[Newsletter],
+    candidates: List[Tuple[UserProfile, List[Newsletter]]],
+    min_overlap: int,
+    require_bio: bool,
+    require_publication: bool,
+    limit: Optional[int] = None,
+) -> List[Match]:
+    """
+    Vectorized rank_matches for large candidate pools.
+
+    Builds one boolean membership matrix of shape (candidates, input subs)
+    and scores every candidate with a single matrix-vector product instead
+    of per-candidate Python loops. Match objects are only constructed for
+    candidates that survive the min_overlap filter.
+    """
+    # Column index per input-sub ID; only these can be shared
+    col_of = {n.id: i for i, n in enumerate(input_user_subs)}
+    weights = np.array(
+        [compute_nicheness_weight(n.subscriber_count) for n in input_user_subs],
+        dtype=np.float32,
+    )
+
+    # Quality filters stay in Python - they're cheap attribute checks
+    kept = [
+        (profile, subs)
+        for profile, subs in candidates
+        if (not require_bio or profile.bio)
+        and (not require_publication or profile.has_publication)
+    ]
+    if not kept:
+        return []
+
+    mask = np.zeros((len(kept), len(input_user_subs)), dtype=bool)
+    for row, (_, subs) in enumerate(kept):
+        for sub in subs:
+            col = col_of.get(sub.id)
+            if col is not None:
+                mask[row, col] = True
+
+    scores = mask @ weights
+    surviving = np.nonzero(mask.sum(axis=1) >= min_overlap)[0]
+
+    matches = []
+    for row in surviving:
+        profile = kept[row][0]
+        shared = [input_user_subs[col] for col in np.nonzero(mask[row])[0]]
+        shared.sort(key=lambda n: n.subscriber_count)
+        quality_bonus = compute_quality_score(profile) * 0.1
+        matches.append(Match(
+            user=profile,
+            score=float(scores[row]) + quality_bonus,
+            shared_newsletters=shared,
+        ))
+
+    return _top_matches(matches, limit)
 
 
 def score_by_appearances(
@@ -147,6 +297,7 @@ def score_by_appearances(
     min_overlap: int = 2,
     require_bio: bool = False,
     require_publication: bool = False,
+    limit: Optional[int] = None,
 ) -> List[Match]:
     """
     Score candidates by how many of user's newsletters they appear in.
@@ -162,10 +313,16 @@ def score_by_appearances(
         min_overlap: Minimum number of newsletters they must appear in
         require_bio: Only include users with a bio
         require_publication: Only include users with their own publication
+        limit: Keep only the top-limit matches (None keeps all)
 
     Returns:
         List of Match objects sorted by score (highest first)
     """
+    if HAS_NUMPY and len(candidates) >= NUMPY_MIN_CANDIDATES:
+        return _score_by_appearances_numpy(
+            candidates, min_overlap, require_bio, require_publication, limit
+        )
+
     matches = []
 
     for user_id, (profile, appeared_in_newsletters) in candidates.items():
@@ -198,7 +355,56 @@ def score_by_appearances(
             shared_newsletters=shared_sorted,
         ))
 
-    # Sort by score (descending)
-    matches.sort()
+    # Sort by score (descending), or top-K select when limited
+    return _top_matches(matches, limit)
 
-    return matches
+
+def _score_by_appearances_numpy(
+    candidates: dict,
+    min_overlap: int,
+    require_bio: bool,
+    require_publication: bool,
+    limit: Optional[int] = None,
+) -> List[Match]:
+    """
+    Vectorized score_by_appearances for large candidate pools.
+
+    Lays the surviving candidates out struct-of-arrays style: every
+    appearance weight goes into one contiguous float array with an offset
+    per candidate, and np.add.reduceat sums each candidate's slice in a
+    single sequential pass instead of a Python generator per candidate.
+    """
+    kept = [
+        (profile, appearances)
+        for profile, appearances in candidates.values()
+        if len(appearances) >= min_overlap
+        and (not require_bio or profile.bio)
+        and (not require_publication or profile.has_publication)
+    ]
+    if not kept:
+        return []
+
+    counts = np.fromiter((len(a) for _, a in kept), dtype=np.int64, count=len(kept))
+    weights_flat = np.fromiter(
+        (
+            compute_nicheness_weight(n.subscriber_count)
+            for _, appearances in kept
+            for n in appearances
+        ),
+        dtype=np.float32,
+        count=int(counts.sum()),
+    )
+    offsets = np.zeros(len(kept), dtype=np.int64)
+    np.cumsum(counts[:-1], out=offsets[1:])
+    scores = np.add.reduceat(weights_flat, offsets)
+
+    matches = []
+    for row, (profile, appearances) in enumerate(kept):
+        quality_bonus = compute_quality_score(profile) * 0.1
+        matches.append(Match(
+            user=profile,
+            score=float(scores[row]) + quality_bonus,
+            shared_newsletters=sorted(appearances, key=lambda n: n.subscriber_count),
+        ))
+
+    return _top_matches(matches, limit)
@@ -2,29 +2,194 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import logging
 import os
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._browser_common import HANDLE_CACHE_TTL, TokenBucket, _AT_HANDLE_RE
+from .cache import CACHE_DIR, cache
+from .types import (
+    Newsletter,
+    UserProfile,
+    _newsletter_to_dict,
+    _profile_to_dict,
+    _users_from_soa,
+    _users_to_soa,
+)
+
+# orjson decodes the multi-KB profile payloads 2-3x faster and takes
+# response bytes directly; stdlib json handles the same input without it.
+# Both raise ValueError subclasses on bad input.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# msgspec decodes straight into typed structs, allocating Python objects
+# only for the declared fields instead of a dict per JSON object - the
+# public_profile payload carries far more than the client reads
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+if HAS_MSGSPEC:
+    # Every field is Optional: defaults only cover *missing* keys, and the
+    # API returns explicit nulls for several of these - a non-Optional
+    # field would turn one null into a ValidationError that kills the
+    # whole fetch. Callers coalesce at construction instead.
+    class _RawPublication(msgspec.Struct):
+        """Subset of a publication object from the public_profile payload."""
+        id: Optional[int] = None
+        name: Optional[str] = None
+        subdomain: Optional[str] = None
+        author_id: Optional[int] = None
+        primary_user_id: Optional[int] = None
+        author: Optional[dict] = None
+        subscriber_count: Optional[int] = None
+
+    class _RawSubscription(msgspec.Struct):
+        publication: Optional[_RawPublication] = None
+
+    class _RawProfile(msgspec.Struct):
+        """Subset of the public_profile payload the client actually reads."""
+        id: Optional[int] = None
+        name: Optional[str] = None
+        bio: Optional[str] = None
+        photo_url: Optional[str] = None
+        primaryPublication: Optional[dict] = None
+        followerCount: Optional[int] = None
+        subscriptions: Optional[List[_RawSubscription]] = None
+
+    _profile_decoder = msgspec.json.Decoder(_RawProfile)
+else:
+    _profile_decoder = None
+
+# Rate limiting - the old fixed 4s gap between requests becomes the
+# steady-state refill (0.25 tokens/sec), but a burst of up to 8 requests
+# after an idle stretch proceeds without sleeping at all
+_bucket = TokenBucket(capacity=8, refill_rate=0.25)
+
+# Serializes bucket updates when bulk helpers fan requests out across
+# threads; waiters queue here until the bucket hands them a token
+_rate_lock = threading.Lock()
+
+# In-memory response cache - a repeated GET inside one run returns the
+# already-parsed body without touching the network or the rate limiter,
+# which otherwise burns a rate-limiter token per duplicate.
+# LRU-bounded so a long crawl can't grow it without limit.
+RESPONSE_CACHE_TTL = 60  # seconds
+RESPONSE_CACHE_MAX = 512
+_response_cache: OrderedDict[tuple, tuple] = OrderedDict()
+
+# Pool workers from the bulk helpers mutate the OrderedDict
+# (move_to_end/popitem), which is not safe to interleave unguarded
+_response_lock = threading.Lock()
+
+# Bucket and response-cache state persisted across CLI invocations, so a
+# fresh process neither bursts past the quota the last run was pacing
+# against nor re-fetches payloads it parsed seconds ago
+HTTP_STATE_FILE = CACHE_DIR / "http_state.json"
+
+
+def _load_http_state() -> None:
+    """Restore the token bucket and fresh responses from the previous run."""
+    try:
+        with open(HTTP_STATE_FILE, "r") as f:
+            state = json.load(f)
+        _bucket.tokens = min(float(_bucket.capacity), float(state["tokens"]))
+        _bucket.last_refill = float(state["last_refill"])
+        now = time.time()
+        for url, params, ts, data in state.get("responses", []):
+            if now - ts < RESPONSE_CACHE_TTL:
+                key = (url, tuple(tuple(p) for p in params))
+                _response_cache[key] = (ts, data)
+    except (IOError, ValueError, KeyError, TypeError):
+        pass
+
+
+def _save_http_state() -> None:
+    """Record the token bucket and still-fresh responses for the next run."""
+    now = time.time()
+    responses = []
+    with _response_lock:
+        entries = list(_response_cache.items())
+    for (url, params), (ts, data) in entries:
+        if now - ts >= RESPONSE_CACHE_TTL:
+            continue
+        # Entries decoded through msgspec are structs, not JSON types;
+        # one of them in the dump would poison the whole file, so skip
+        # anything json can't round-trip
+        try:
+            json.dumps(data)
+        except (TypeError, ValueError):
+            continue
+        responses.append([url, list(params), ts, data])
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a failed dump can't truncate the previous
+        # run's state
+        tmp = HTTP_STATE_FILE.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump({
+                "tokens": _bucket.tokens,
+                "last_refill": _bucket.last_refill,
+                "responses": responses,
+            }, f)
+        os.replace(tmp, HTTP_STATE_FILE)
+    except IOError:
+        pass
+
 
-from .cache import cache
-from .types import Newsletter, UserProfile
+_load_http_state()
+atexit.register(_save_http_state)
 
-# Rate limiting - increased to avoid 429 errors
-MIN_REQUEST_INTERVAL = 4.0  # seconds between requests
-_last_request_time = 0.0
+# Warnings go through logging, not print - a handler-less logger is
+# nearly free, and stdout stays clean for actual results. The CLI entry
+# point configures the handler.
+logger = logging.getLogger(__name__)
 
 BASE_URL = "https://substack.com/api/v1"
 
+# Profiles change rarely; subscriptions churn, so they keep the default TTL
+PROFILE_CACHE_TTL = 7 * 86400  # 7 days
+
 # Standard headers to mimic browser requests
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
     "Accept": "application/json",
 }
 
+# One keep-alive session for all calls - top-level requests.get pays a
+# fresh TCP+TLS handshake per request. Headers are set once here and
+# never mutated afterward, so the session stays thread-safe; cookies are
+# passed per-call to keep the require_auth gating in _make_request
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    ),
+))
+_session.headers.update(HEADERS)
+
 # Session cookies for authenticated requests
 _session_cookies: Optional[Dict[str, str]] = None
 
@@ -57,19 +222,19 @@ def load_cookies(cookie_path: Optional[str] = None) -> bool:
     env_cookies = os.environ.get("SUBSTACK_COOKIES")
     if env_cookies:
         try:
-            _session_cookies = json.loads(env_cookies)
+            _session_cookies = _json_loads(env_cookies)
             return True
-        except json.JSONDecodeError:
+        except ValueError:
             pass
 
     # Try file paths
     for path in paths_to_try:
         if path.exists():
             try:
-                with open(path) as f:
-                    _session_cookies = json.load(f)
+                with open(path, "rb") as f:
+                    _session_cookies = _json_loads(f.read())
                 return True
-            except (json.JSONDecodeError, IOError):
+            except (ValueError, IOError):
                 pass
 
     return False
@@ -82,16 +247,25 @@ def set_cookies(cookies: Dict[str, str]) -> None:
 
 
 def _rate_limit() -> None:
-    """Ensure we don't exceed rate limits."""
-    global _last_request_time
-    elapsed = time.time() - _last_request_time
-    if elapsed < MIN_REQUEST_INTERVAL:
-        time.sleep(MIN_REQUEST_INTERVAL - elapsed)
-    _last_request_time = time.time()
-
+    """Ensure we don't exceed rate limits via the shared token bucket."""
+    with _rate_lock:
+        _bucket.acquire()
+
+
+def _make_request(
+    url: str,
+    params: Optional[dict] = None,
+    require_auth: bool = False,
+    decoder: Optional[Any] = None,
+) -> Any:
+    """Make a rate-limited GET request, optionally through a typed decoder."""
+    cache_key = (url, tuple(sorted((params or {}).items())))
+    with _response_lock:
+        hit = _response_cache.get(cache_key)
+        if hit is not None and time.time() - hit[0] < RESPONSE_CACHE_TTL:
+            _response_cache.move_to_end(cache_key)
+            return hit[1]
 
-def _make_request(url: str, params: Optional[dict] = None, require_auth: bool = False) -> dict:
-    """Make a rate-limited GET request."""
     _rate_limit()
 
     cookies = _session_cookies if _session_cookies else {}
@@ -102,9 +276,28 @@ def _make_request(url: str, params: Optional[dict] = None, require_auth: bool =
             "See ~/.substack-cookies.json or SUBSTACK_COOKIES env var."
         )
 
-    response = requests.get(url, params=params, headers=HEADERS, cookies=cookies, timeout=30)
+    response = _session.get(url, params=params, cookies=cookies, timeout=30)
     response.raise_for_status()
-    return response.json()
+    if decoder is not None:
+        data = decoder.decode(response.content)
+    else:
+        # Decode from the raw bytes - skips the str decode inside response.json()
+        data = _json_loads(response.content)
+
+    with _response_lock:
+        _response_cache[cache_key] = (time.time(), data)
+        _response_cache.move_to_end(cache_key)
+        while len(_response_cache) > RESPONSE_CACHE_MAX:
+            _response_cache.popitem(last=False)
+
+    return data
+
+
+# username -> current handle, checked before the redirect-following GET.
+# Handles almost never change, and both get_user_profile and
+# get_user_subscriptions resolve before fetching, so without this one
+# profile lookup costs two extra requests
+_handle_resolution_cache: Dict[str, str] = {}
 
 
 def _resolve_handle(username: str) -> str:
@@ -114,36 +307,93 @@ def _resolve_handle(username: str) -> str:
     Substack allows users to change their handle. This follows
     redirects to find the current handle.
     """
+    resolved = _handle_resolution_cache.get(username)
+    if resolved is not None:
+        return resolved
+
+    # "handle:" keys map subdomain -> handle for the browser clients;
+    # username -> handle lives under its own prefix
+    cache_key = f"resolved:{username}"
+    resolved = cache.get(cache_key)
+    if resolved is not None:
+        _handle_resolution_cache[username] = resolved
+        return resolved
+
     try:
-        response = requests.get(
+        # Only the redirect target matters, not the profile HTML - HEAD
+        # moves a few hundred bytes where GET moved the whole page
+        response = _session.head(
             f"https://substack.com/@{username}",
-            headers=HEADERS,
             allow_redirects=True,
-            timeout=30,
+            timeout=10,
         )
-        # Extract handle from final URL
-        final_url = str(response.url)
-        if "/@" in final_url:
-            return final_url.split("/@")[-1].split("?")[0].split("/")[0]
+        if response.status_code >= 400:
+            # Server rejected HEAD; stream the GET and drop the body unread
+            response = _session.get(
+                f"https://substack.com/@{username}",
+                allow_redirects=True,
+                stream=True,
+                timeout=30,
+            )
+            response.close()
+        # Extract handle from final URL - one C-level regex pass instead
+        # of three intermediate split lists
+        match = _AT_HANDLE_RE.search(str(response.url))
+        if match:
+            resolved = match.group(1)
+            _handle_resolution_cache[username] = resolved
+            cache.set(cache_key, resolved, ttl=HANDLE_CACHE_TTL)
+            return resolved
     except Exception:
         pass
     return username
 
 
-def get_user_profile(username: str) -> Optional[UserProfile]:
-    """Get a user's profile by username."""
-    cache_key = f"profile:{username}"
-    cached = cache.get(cache_key)
-    if cached:
-        return UserProfile(**cached)
+def _fetch_profile_payload(username: str) -> Tuple[UserProfile, List[Newsletter]]:
+    """
+    Fetch the public_profile payload and derive everything it carries.
 
-    try:
-        # Resolve handle in case it changed
-        resolved_username = _resolve_handle(username)
+    The same endpoint serves both the profile and the subscription list,
+    so parse both and populate both caches in one round-trip - a caller
+    asking for profile then subscriptions costs one request, not two.
+    """
+    # Resolve handle in case it changed
+    resolved_username = _resolve_handle(username)
+
+    url = f"{BASE_URL}/user/{resolved_username}/public_profile"
+    data = _make_request(url, decoder=_profile_decoder)
+
+    newsletters = []
+    if HAS_MSGSPEC:
+        primary_pub = data.primaryPublication
+        profile = UserProfile(
+            id=data.id or 0,
+            username=resolved_username,
+            name=data.name or resolved_username,
+            bio=data.bio,
+            photo_url=data.photo_url,
+            has_publication=primary_pub is not None,
+            publication_url=primary_pub.get("url") if primary_pub else None,
+            follower_count=data.followerCount or 0,
+        )
+
+        for sub in data.subscriptions or ():
+            pub = sub.publication
+            if not pub:
+                continue
 
-        url = f"{BASE_URL}/user/{resolved_username}/public_profile"
-        data = _make_request(url)
+            author = pub.author or {}
+            author_id = pub.author_id or pub.primary_user_id or author.get("id", 0)
 
+            newsletters.append(Newsletter(
+                id=pub.id or 0,
+                name=pub.name or "Unknown",
+                subdomain=pub.subdomain or "",
+                author_id=author_id,
+                subscriber_count=pub.subscriber_count or 0,
+                url=f"https://{pub.subdomain}.substack.com" if pub.subdomain else None,
+            ))
+    else:
         profile = UserProfile(
             id=data.get("id", 0),
             username=resolved_username,
@@ -155,46 +405,7 @@ def get_user_profile(username: str) -> Optional[UserProfile]:
             follower_count=data.get("followerCount", 0),
         )
 
-        # Cache the profile
-        cache.set(cache_key, {
-            "id": profile.id,
-            "username": profile.username,
-            "name": profile.name,
-            "bio": profile.bio,
-            "photo_url": profile.photo_url,
-            "has_publication": profile.has_publication,
-            "publication_url": profile.publication_url,
-            "follower_count": profile.follower_count,
-        })
-
-        return profile
-    except requests.exceptions.HTTPError as e:
-        print(f"HTTP error fetching profile for {username}: {e}")
-        return None
-    except Exception as e:
-        print(f"Error fetching profile for {username}: {e}")
-        return None
-
-
-def get_user_subscriptions(username: str) -> List[Newsletter]:
-    """Get a user's subscriptions (newsletters they follow)."""
-    cache_key = f"subscriptions:{username}"
-    cached = cache.get(cache_key)
-    if cached:
-        return [Newsletter(**n) for n in cached]
-
-    try:
-        # Resolve handle in case it changed
-        resolved_username = _resolve_handle(username)
-
-        url = f"{BASE_URL}/user/{resolved_username}/public_profile"
-        data = _make_request(url)
-
-        # Subscriptions are included in the profile response
-        subs_data = data.get("subscriptions", [])
-
-        newsletters = []
-        for sub in subs_data:
+        for sub in data.get("subscriptions", []):
             # The subscription data has publication nested inside
             pub = sub.get("publication", {})
             if not pub:
@@ -204,35 +415,107 @@ def get_user_subscriptions(username: str) -> List[Newsletter]:
             author = pub.get("author", {})
             author_id = pub.get("author_id") or pub.get("primary_user_id") or author.get("id", 0)
 
-            newsletter = Newsletter(
+            newsletters.append(Newsletter(
                 id=pub.get("id", 0),
                 name=pub.get("name", "Unknown"),
                 subdomain=pub.get("subdomain", ""),
                 author_id=author_id,
                 subscriber_count=pub.get("subscriber_count", 0),
                 url=f"https://{pub.get('subdomain', '')}.substack.com" if pub.get("subdomain") else None,
-            )
-            newsletters.append(newsletter)
-
-        # Cache the subscriptions
-        cache.set(cache_key, [
-            {
-                "id": n.id,
-                "name": n.name,
-                "subdomain": n.subdomain,
-                "author_id": n.author_id,
-                "subscriber_count": n.subscriber_count,
-                "url": n.url,
-            }
-            for n in newsletters
-        ])
+            ))
+
+    # Cache both derived views
+    cache.set(f"profile:{username}", _profile_to_dict(profile), ttl=PROFILE_CACHE_TTL)
+    cache.set(f"subscriptions:{username}", [_newsletter_to_dict(n) for n in newsletters])
+
+    return profile, newsletters
+
+
+def get_user_profile(username: str) -> Optional[UserProfile]:
+    """Get a user's profile by username."""
+    cached = cache.get(f"profile:{username}")
+    if cached:
+        return UserProfile(**cached)
+
+    try:
+        profile, _ = _fetch_profile_payload(username)
+        return profile
+    except requests.exceptions.HTTPError as e:
+        logger.warning("HTTP error fetching profile for %s: %s", username, e)
+        return None
+    except Exception as e:
+        logger.warning("Error fetching profile for %s: %s", username, e)
+        return None
+
+
+def get_user_profiles_cached_bulk(
+    usernames: List[str],
+) -> Tuple[Dict[str, UserProfile], List[str]]:
+    """
+    Look up many profiles from the cache in one batched read.
 
+    Args:
+        usernames: Usernames to look up
+
+    Returns:
+        Tuple of (username -> cached profile, usernames not in the cache);
+        pass the misses to get_user_profiles_bulk to fetch them.
+    """
+    hits = cache.mget([f"profile:{u}" for u in usernames])
+    profiles = {}
+    misses = []
+    for username in usernames:
+        cached = hits.get(f"profile:{username}")
+        if cached:
+            profiles[username] = UserProfile(**cached)
+        else:
+            misses.append(username)
+    return profiles, misses
+
+
+def get_user_profiles_bulk(
+    usernames: List[str],
+    max_workers: int = 4,
+) -> List[Optional[UserProfile]]:
+    """
+    Fetch many user profiles concurrently.
+
+    Cached profiles are resolved with one batched cache read; only the
+    misses hit the network. The token bucket still governs the overall
+    request rate, so workers queue behind it rather than oversubscribing
+    quota - the win is the overlapped TLS handshake, transfer, and decode
+    time per request.
+
+    Args:
+        usernames: Usernames to fetch
+        max_workers: Maximum concurrent fetches
+
+    Returns:
+        Profiles in the same order as usernames, None where a fetch failed
+    """
+    if not usernames:
+        return []
+    profiles, misses = get_user_profiles_cached_bulk(usernames)
+    if misses:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            profiles.update(zip(misses, executor.map(get_user_profile, misses)))
+    return [profiles.get(u) for u in usernames]
+
+
+def get_user_subscriptions(username: str) -> List[Newsletter]:
+    """Get a user's subscriptions (newsletters they follow)."""
+    cached = cache.get(f"subscriptions:{username}")
+    if cached:
+        return [Newsletter(**n) for n in cached]
+
+    try:
+        _, newsletters = _fetch_profile_payload(username)
         return newsletters
     except requests.exceptions.HTTPError as e:
-        print(f"HTTP error fetching subscriptions for {username}: {e}")
+        logger.warning("HTTP error fetching subscriptions for %s: %s", username, e)
         return []
     except Exception as e:
-        print(f"Error fetching subscriptions for {username}: {e}")
+        logger.warning("Error fetching subscriptions for %s: %s", username, e)
         return []
 
 
@@ -250,6 +533,9 @@ def get_publication_followers(user_id: int, limit: int = 100) -> List[UserProfil
     cache_key = f"followers:{user_id}:{limit}"
     cached = cache.get(cache_key)
     if cached:
+        # SoA dict from current code; older entries are per-user dict lists
+        if isinstance(cached, dict):
+            return _users_from_soa(cached)
         return [UserProfile(**p) for p in cached]
 
     url = f"{BASE_URL}/user/{user_id}/subscriber-lists"
@@ -262,39 +548,30 @@ def get_publication_followers(user_id: int, limit: int = 100) -> List[UserProfil
         follower_list = data.get("followers", [])[:limit]
 
         for f in follower_list:
-            profile = UserProfile(
-                id=f.get("id", 0),
-                username=f.get("handle", f.get("username", "")),
-                name=f.get("name", ""),
-                bio=f.get("bio"),
-                photo_url=f.get("photo_url"),
-                has_publication=bool(f.get("primaryPublication")),
-                publication_url=f.get("primaryPublication", {}).get("url") if f.get("primaryPublication") else None,
-                follower_count=f.get("followerCount", 0),
-            )
-            followers.append(profile)
-
-        # Cache the followers
-        cache.set(cache_key, [
-            {
-                "id": p.id,
-                "username": p.username,
-                "name": p.name,
-                "bio": p.bio,
-                "photo_url": p.photo_url,
-                "has_publication": p.has_publication,
-                "publication_url": p.publication_url,
-                "follower_count": p.follower_count,
-            }
-            for p in followers
-        ])
+            # Bind .get and primaryPublication once per record instead of
+            # re-looking both up per field
+            g = f.get
+            primary_pub = g("primaryPublication")
+            followers.append(UserProfile(
+                id=g("id", 0),
+                username=g("handle") or g("username", ""),
+                name=g("name", ""),
+                bio=g("bio"),
+                photo_url=g("photo_url"),
+                has_publication=primary_pub is not None,
+                publication_url=primary_pub.get("url") if primary_pub else None,
+                follower_count=g("followerCount", 0),
+            ))
+
+        # Cache the followers in struct-of-arrays form
+        cache.set(cache_key, _users_to_soa(followers))
 
         return followers
     except requests.exceptions.HTTPError as e:
-        print(f"HTTP error fetching followers for user {user_id}: {e}")
+        logger.warning("HTTP error fetching followers for user %s: %s", user_id, e)
         return []
     except Exception as e:
-        print(f"Error fetching followers for user {user_id}: {e}")
+        logger.warning("Error fetching followers for user %s: %s", user_id, e)
         return []
 
 
@@ -323,7 +600,7 @@ def get_publication_posts(subdomain: str, limit: int = 5) -> List[dict]:
         cache.set(cache_key, posts)
         return posts
     except Exception as e:
-        print(f"Error fetching posts for {subdomain}: {e}")
+        logger.warning("Error fetching posts for %s: %s", subdomain, e)
         return []
 
 
@@ -342,6 +619,9 @@ def get_post_commenters(subdomain: str, post_id: int, limit: int = 50) -> List[U
     cache_key = f"commenters:{subdomain}:{post_id}:{limit}"
     cached = cache.get(cache_key)
     if cached:
+        # SoA dict from current code; older entries are per-user dict lists
+        if isinstance(cached, dict):
+            return _users_from_soa(cached)
         return [UserProfile(**p) for p in cached]
 
     url = f"https://{subdomain}.substack.com/api/v1/post/{post_id}/comments"
@@ -351,57 +631,45 @@ def get_post_commenters(subdomain: str, post_id: int, limit: int = 50) -> List[U
         data = _make_request(url, params)
         comments = data.get("comments", [])
 
-        # Extract unique users from comments (including nested children)
+        # Extract unique users from comments (including nested children).
+        # An explicit queue instead of recursion - deep reply threads cost
+        # a Python frame per comment otherwise and can hit the recursion
+        # limit
         seen_ids: set = set()
         users: List[UserProfile] = []
-
-        def extract_users(comment_list: list) -> None:
-            for c in comment_list:
-                user_id = c.get("user_id", 0)
-                if user_id and user_id not in seen_ids:
-                    seen_ids.add(user_id)
-
-                    # Check if user has their own publication
-                    metadata = c.get("metadata", {})
-                    author_pub = metadata.get("author_on_other_pub", {})
-
-                    profile = UserProfile(
-                        id=user_id,
-                        username=c.get("handle", ""),
-                        name=c.get("name", ""),
-                        bio=None,  # Not available in comments
-                        photo_url=c.get("photo_url"),
-                        has_publication=bool(author_pub),
-                        publication_url=author_pub.get("base_url") if author_pub else None,
-                        follower_count=0,
-                    )
-                    users.append(profile)
-
-                # Process nested children
-                children = c.get("children", [])
-                if children:
-                    extract_users(children)
-
-        extract_users(comments)
-
-        # Cache the results
-        cache.set(cache_key, [
-            {
-                "id": p.id,
-                "username": p.username,
-                "name": p.name,
-                "bio": p.bio,
-                "photo_url": p.photo_url,
-                "has_publication": p.has_publication,
-                "publication_url": p.publication_url,
-                "follower_count": p.follower_count,
-            }
-            for p in users[:limit]
-        ])
+        queue = deque(comments)
+
+        while queue:
+            c = queue.popleft()
+            g = c.get
+            user_id = g("user_id", 0)
+            if user_id and user_id not in seen_ids:
+                seen_ids.add(user_id)
+
+                # Check if user has their own publication
+                metadata = g("metadata", {})
+                author_pub = metadata.get("author_on_other_pub", {})
+
+                users.append(UserProfile(
+                    id=user_id,
+                    username=g("handle", ""),
+                    name=g("name", ""),
+                    bio=None,  # Not available in comments
+                    photo_url=g("photo_url"),
+                    has_publication=bool(author_pub),
+                    publication_url=author_pub.get("base_url") if author_pub else None,
+                    follower_count=0,
+                ))
+
+            # Queue nested children
+            queue.extend(g("children") or ())
+
+        # Cache the results in struct-of-arrays form
+        cache.set(cache_key, _users_to_soa(users[:limit]))
 
         return users[:limit]
     except Exception as e:
-        print(f"Error fetching commenters for post {post_id}: {e}")
+        logger.warning("Error fetching commenters for post %s: %s", post_id, e)
         return []
 
 
@@ -419,6 +687,9 @@ def get_publication_subscribers(user_id: int, limit: int = 100) -> List[UserProf
     cache_key = f"subscribers:{user_id}:{limit}"
     cached = cache.get(cache_key)
     if cached:
+        # SoA dict from current code; older entries are per-user dict lists
+        if isinstance(cached, dict):
+            return _users_from_soa(cached)
         return [UserProfile(**p) for p in cached]
 
     url = f"{BASE_URL}/user/{user_id}/subscriber-lists"
@@ -431,37 +702,28 @@ def get_publication_subscribers(user_id: int, limit: int = 100) -> List[UserProf
         subscriber_list = data.get("subscribers", [])[:limit]
 
         for s in subscriber_list:
-            profile = UserProfile(
-                id=s.get("id", 0),
-                username=s.get("handle", s.get("username", "")),
-                name=s.get("name", ""),
-                bio=s.get("bio"),
-                photo_url=s.get("photo_url"),
-                has_publication=bool(s.get("primaryPublication")),
-                publication_url=s.get("primaryPublication", {}).get("url") if s.get("primaryPublication") else None,
-                follower_count=s.get("followerCount", 0),
-            )
-            subscribers.append(profile)
-
-        # Cache the subscribers
-        cache.set(cache_key, [
-            {
-                "id": p.id,
-                "username": p.username,
-                "name": p.name,
-                "bio": p.bio,
-                "photo_url": p.photo_url,
-                "has_publication": p.has_publication,
-                "publication_url": p.publication_url,
-                "follower_count": p.follower_count,
-            }
-            for p in subscribers
-        ])
+            # Bind .get and primaryPublication once per record instead of
+            # re-looking both up per field
+            g = s.get
+            primary_pub = g("primaryPublication")
+            subscribers.append(UserProfile(
+                id=g("id", 0),
+                username=g("handle") or g("username", ""),
+                name=g("name", ""),
+                bio=g("bio"),
+                photo_url=g("photo_url"),
+                has_publication=primary_pub is not None,
+                publication_url=primary_pub.get("url") if primary_pub else None,
+                follower_count=g("followerCount", 0),
+            ))
+
+        # Cache the subscribers in struct-of-arrays form
+        cache.set(cache_key, _users_to_soa(subscribers))
 
         return subscribers
     except requests.exceptions.HTTPError as e:
-        print(f"HTTP error fetching subscribers for user {user_id}: {e}")
+        logger.warning("HTTP error fetching subscribers for user %s: %s", user_id, e)
         return []
     except Exception as e:
-        print(f"Error fetching subscribers for user {user_id}: {e}")
+        logger.warning("Error fetching subscribers for user %s: %s", user_id, e)
         return []
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional
 
+# slots=True drops the per-instance __dict__ (~100 B each on CPython,
+# and candidate lists hold thousands of instances); frozen=True makes
+# instances safely shareable across the cache and scoring paths
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class UserProfile:
     """A Substack user profile."""
     id: int
@@ -18,8 +23,16 @@ class UserProfile:
     publication_url: Optional[str] = None
     follower_count: int = 0
 
+    def __post_init__(self) -> None:
+        # The same handle recurs across many subscriber lists; interning
+        # collapses the duplicates to one string object. Legacy cache
+        # entries and explicit API nulls can leave this None - intern
+        # only actual strings
+        if isinstance(self.username, str):
+            object.__setattr__(self, "username", sys.intern(self.username))
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Newsletter:
     """A Substack newsletter/publication."""
     id: int
@@ -29,8 +42,14 @@ class Newsletter:
     subscriber_count: int = 0
     url: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # The same publication appears in many users' subscription lists;
+        # None slips in from legacy cache entries and explicit API nulls
+        if isinstance(self.subdomain, str):
+            object.__setattr__(self, "subdomain", sys.intern(self.subdomain))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Match:
     """A matched user with overlap score."""
     user: UserProfile
@@ -40,3 +59,35 @@ class Match:
     def __lt__(self, other: "Match") -> bool:
         """Sort by score descending."""
         return self.score > other.score
+
+
+# Field names straight from the dataclass definitions, so serializers
+# can't drift out of sync with the types they flatten
+_PROFILE_FIELDS = tuple(f.name for f in fields(UserProfile))
+_NEWSLETTER_FIELDS = tuple(f.name for f in fields(Newsletter))
+
+
+def _profile_to_dict(profile: UserProfile) -> Dict:
+    """Flatten a UserProfile into a cacheable dict."""
+    return {name: getattr(profile, name) for name in _PROFILE_FIELDS}
+
+
+def _newsletter_to_dict(newsletter: Newsletter) -> Dict:
+    """Flatten a Newsletter into a cacheable dict."""
+    return {name: getattr(newsletter, name) for name in _NEWSLETTER_FIELDS}
+
+
+def _users_to_soa(users: List[UserProfile]) -> Dict[str, List]:
+    """
+    Pack UserProfiles into a struct-of-arrays dict for caching.
+
+    One list per field instead of one ~200-byte dict per user - roughly
+    halves cache entry size for a 100-user list.
+    """
+    return {name: [getattr(u, name) for u in users] for name in _PROFILE_FIELDS}
+
+
+def _users_from_soa(soa: Dict[str, List]) -> List[UserProfile]:
+    """Unpack a struct-of-arrays cache entry back into UserProfiles."""
+    names = _PROFILE_FIELDS
+    return [UserProfile(**dict(zip(names, row))) for row in zip(*(soa[n] for n in names))]